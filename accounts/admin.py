@@ -1,6 +1,9 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin
-from django.db.models import F
+from django.db import transaction
+from django.db.models import Case, F, TextField, Value, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from .models import (
@@ -11,6 +14,47 @@ from .models import (
     KYCDocument,
 )
 
+# CustomUser.is_verified follows KYCProfile.status via DB triggers
+# (migrations 0009/0017), so the KYC admin only writes KYC rows and points.
+# PENDING leaves the flag as it is; only a review decision changes it.
+
+
+# -----------------------------
+# Changelist helpers
+# -----------------------------
+class DeferredChangeList(ChangeList):
+    """Changelist that skips the admin's `changelist_defer` columns (never shown in list_display)."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        qs = super().get_queryset(request, *args, **kwargs)
+        return qs.defer(*self.model_admin.changelist_defer)
+
+
+class ChangelistDeferMixin:
+    # only the changelist is narrowed; change forms still load full rows
+    changelist_defer = ()
+
+    def get_changelist(self, request, **kwargs):
+        return DeferredChangeList
+
+
+# -----------------------------
+# Filters
+# -----------------------------
+class FamilyBloodGroupFilter(admin.SimpleListFilter):
+    # FamilyMember.blood_group has no model choices, so the default filter
+    # would run SELECT DISTINCT over the whole table on every changelist render.
+    title = "blood group"
+    parameter_name = "blood_group"
+
+    def lookups(self, request, model_admin):
+        return UserProfile.BLOOD_GROUPS
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(blood_group=self.value())
+        return queryset
+
 
 # -----------------------------
 # Inlines
@@ -27,8 +71,9 @@ class UserProfileInline(admin.StackedInline):
 # Custom User
 # -----------------------------
 @admin.register(CustomUser)
-class CustomUserAdmin(UserAdmin):
+class CustomUserAdmin(ChangelistDeferMixin, UserAdmin):
     inlines = (UserProfileInline,)
+    changelist_defer = ("profile_image",)
 
     list_display = (
         "username",
@@ -56,11 +101,14 @@ class CustomUserAdmin(UserAdmin):
     search_fields = ("username", "email", "phone_number", "first_name", "last_name")
     ordering = ("-date_joined",)
 
-    # show points from related profile (safe if missing)
-    @admin.display(description="Points")
+    def get_queryset(self, request):
+        # points column: read profile.points through the LEFT JOIN (0 if no profile),
+        # no per-row profile fetch and no RelatedObjectDoesNotExist handling
+        return super().get_queryset(request).annotate(profile_points=Coalesce("profile__points", 0))
+
+    @admin.display(description="Points", ordering="profile_points")
     def points(self, obj):
-        prof = getattr(obj, "profile", None)
-        return getattr(prof, "points", 0) if prof else 0
+        return obj.profile_points
 
     fieldsets = UserAdmin.fieldsets + (
         ("Share4Life Roles / Flags", {
@@ -98,45 +146,41 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_filter = ("blood_group", "city")
     search_fields = ("user__username", "user__email", "city")
     autocomplete_fields = ("user",)
+    list_select_related = ("user",)
 
 
 @admin.register(FamilyMember)
 class FamilyMemberAdmin(admin.ModelAdmin):
     list_display = ("id", "primary_user", "name", "relationship", "blood_group", "city", "is_emergency_profile")
-    list_filter = ("is_emergency_profile", "city", "blood_group")
+    list_filter = ("is_emergency_profile", "city", FamilyBloodGroupFilter)
     search_fields = ("name", "relationship", "primary_user__username", "primary_user__email", "city")
     autocomplete_fields = ("primary_user",)
+    list_select_related = ("primary_user",)
 
 
 # -----------------------------
 # KYC
 # -----------------------------
 @admin.register(KYCProfile)
-class KYCProfileAdmin(admin.ModelAdmin):
+class KYCProfileAdmin(ChangelistDeferMixin, admin.ModelAdmin):
     list_display = ("user", "status", "submitted_at", "reviewed_at", "reviewed_by")
     list_filter = ("status",)
     search_fields = ("user__username", "user__email", "id_number")
     autocomplete_fields = ("user", "reviewed_by")
+    list_select_related = ("user", "reviewed_by")
+    changelist_defer = ("rejection_reason",)
     readonly_fields = ("submitted_at",)
 
     actions = ["approve_kyc", "reject_kyc"]
 
-    def _sync_user_verified(self, kyc: KYCProfile):
-        u = kyc.user
-        u.is_verified = (kyc.status == "APPROVED")
-        u.save(update_fields=["is_verified"])
-
-    def _award_kyc_points_once(self, user):
-        # +200 points on KYC approval (safe)
-        try:
-            UserProfile.objects.filter(user=user).update(points=F("points") + 200)
-        except Exception:
-            pass
+    def _award_kyc_points(self, user_ids):
+        # +200 points on KYC approval, one UPDATE for the whole set
+        if user_ids:
+            UserProfile.objects.filter(user_id__in=user_ids).update(points=F("points") + 200)
 
     def save_model(self, request, obj, form, change):
-        old_status = None
-        if change and obj.pk:
-            old_status = KYCProfile.objects.filter(pk=obj.pk).values_list("status", flat=True).first()
+        # pre-edit status is already on the bound form (populated from the DB row)
+        old_status = form.initial.get("status") if change else None
 
         # mark review info when changed in admin
         if change:
@@ -145,39 +189,38 @@ class KYCProfileAdmin(admin.ModelAdmin):
 
         super().save_model(request, obj, form, change)
 
-        # sync user verified flag
-        self._sync_user_verified(obj)
-
         # award points only if transitioned into APPROVED
         if old_status != "APPROVED" and obj.status == "APPROVED":
-            self._award_kyc_points_once(obj.user)
+            self._award_kyc_points([obj.user_id])
 
     @admin.action(description="Approve selected KYC (marks user verified)")
+    @transaction.atomic
     def approve_kyc(self, request, queryset):
-        for kyc in queryset.select_related("user"):
-            old_status = kyc.status
-
-            kyc.status = "APPROVED"
-            kyc.reviewed_at = timezone.now()
-            kyc.reviewed_by = request.user
-            kyc.rejection_reason = ""
-            kyc.save(update_fields=["status", "reviewed_at", "reviewed_by", "rejection_reason"])
-
-            self._sync_user_verified(kyc)
-
-            if old_status != "APPROVED":
-                self._award_kyc_points_once(kyc.user)
+        # read old statuses once, so points are only awarded on transition into APPROVED
+        old_statuses = list(queryset.values_list("user_id", "status"))
+        award_ids = [uid for uid, status in old_statuses if status != "APPROVED"]
+
+        queryset.update(
+            status="APPROVED",
+            reviewed_at=timezone.now(),
+            reviewed_by=request.user,
+            rejection_reason="",
+        )
+        self._award_kyc_points(award_ids)
 
     @admin.action(description="Reject selected KYC (marks user not verified)")
+    @transaction.atomic
     def reject_kyc(self, request, queryset):
-        for kyc in queryset.select_related("user"):
-            kyc.status = "REJECTED"
-            kyc.reviewed_at = timezone.now()
-            kyc.reviewed_by = request.user
-            if not kyc.rejection_reason:
-                kyc.rejection_reason = "Rejected by admin."
-            kyc.save(update_fields=["status", "reviewed_at", "reviewed_by", "rejection_reason"])
-            self._sync_user_verified(kyc)
+        queryset.update(
+            status="REJECTED",
+            reviewed_at=timezone.now(),
+            reviewed_by=request.user,
+            rejection_reason=Case(
+                When(rejection_reason="", then=Value("Rejected by admin.")),
+                default=F("rejection_reason"),
+                output_field=TextField(),
+            ),
+        )
 
 
 @admin.register(KYCDocument)
@@ -185,4 +228,5 @@ class KYCDocumentAdmin(admin.ModelAdmin):
     list_display = ("kyc", "doc_type", "uploaded_at")
     list_filter = ("doc_type",)
     search_fields = ("kyc__user__username", "kyc__user__email")
-    autocomplete_fields = ("kyc",)
\ No newline at end of file
+    autocomplete_fields = ("kyc",)
+    list_select_related = ("kyc", "kyc__user")
\ No newline at end of file
@@ -0,0 +1,16 @@
+# accounts/converters.py
+
+
+class SignedTokenConverter:
+    """
+    Matches django.core.signing output ("<payload>:<timestamp>:<signature>",
+    URL-safe base64 plus ":" separators; payload starts with "." when compressed).
+    Anything else 404s at resolve() time instead of reaching the view.
+    """
+    regex = r"[A-Za-z0-9_\-.]{8,}:[A-Za-z0-9]+:[A-Za-z0-9_\-]{20,}"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
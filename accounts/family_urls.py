@@ -0,0 +1,12 @@
+# accounts/family_urls.py
+# Family members / emergency profiles, mounted under "family/" by accounts/urls.py.
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("add/", views.family_add, name="family_add"),
+    path("emergency/", views.emergency_profiles_list, name="emergency_profiles_list"),
+    path("<int:pk>/edit/", views.family_edit, name="family_edit"),
+    path("<int:pk>/delete/", views.family_delete, name="family_delete"),
+]
@@ -1,7 +1,12 @@
 from django import forms
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.contrib.auth.forms import PasswordResetForm, SetPasswordForm
-from .models import CustomUser, UserProfile
-from .models import FamilyMember
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from .models import CustomUser, UserProfile, FamilyMember
+
+# built once at import; shared by every FamilyMemberForm
+FAMILY_BLOOD_GROUP_CHOICES = (("", "— Select —"),) + UserProfile.BLOOD_GROUPS
 
 
 class RegistrationForm(forms.ModelForm):
@@ -22,19 +27,54 @@ class RegistrationForm(forms.ModelForm):
         if password and confirm_password and password != confirm_password:
             self.add_error("confirm_password", "Passwords do not match")
 
+        # Form already fails on cheap checks: skip the DB uniqueness probe
+        if self._errors:
+            return cleaned_data
+
+        # One query for both uniqueness checks; compares LOWER(col) so the
+        # functional indexes on CustomUser are used (iexact compiles to UPPER/LIKE)
+        email = cleaned_data.get("email")
+        username = cleaned_data.get("username")
+        lookup = Q()
+        if email:
+            lookup |= Q(email_lower=email)
+        if username:
+            lookup |= Q(username_lower=username.lower())
+
+        if lookup:
+            taken = (
+                CustomUser.objects
+                .alias(email_lower=Lower("email"), username_lower=Lower("username"))
+                .filter(lookup)
+                .values_list("email", "username")
+            )
+            for taken_email, taken_username in taken:
+                if email and (taken_email or "").lower() == email and "email" not in self._errors:
+                    self.add_error("email", "Email is already registered")
+                if username and taken_username.lower() == username.lower() and "username" not in self._errors:
+                    self.add_error("username", "Username is already taken")
+
         return cleaned_data  
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # model-level validation of username is skipped below, so run its character
+        # check on the form field (the field already carries the max_length validator)
+        self.fields["username"].validators.append(UnicodeUsernameValidator())
+
+    def _get_validation_exclusions(self):
+        # clean() already checks case-insensitive email/username uniqueness in one
+        # query; skip the model's unique/constraint re-checks (2-3 more queries,
+        # with generic non-field messages)
+        exclude = super()._get_validation_exclusions()
+        exclude.update({"username", "email"})
+        return exclude
+
     def clean_email(self):
-        email = (self.cleaned_data.get("email") or "").strip().lower()
-        if CustomUser.objects.filter(email__iexact=email).exists():
-            raise forms.ValidationError("Email is already registered")
-        return email
+        return (self.cleaned_data.get("email") or "").strip().lower()
 
     def clean_username(self):
-        username = (self.cleaned_data.get("username") or "").strip()
-        if CustomUser.objects.filter(username__iexact=username).exists():
-            raise forms.ValidationError("Username is already taken")
-        return username
+        return (self.cleaned_data.get("username") or "").strip()
 
 
 class BootstrapPasswordResetForm(PasswordResetForm):
@@ -50,21 +90,30 @@ class BootstrapSetPasswordForm(SetPasswordForm):
         super().__init__(*args, **kwargs)
         self.fields["new_password1"].widget.attrs.update({"class": "form-control"})
         self.fields["new_password2"].widget.attrs.update({"class": "form-control"})
-
-    def clean_new_password2(self):
-        new_password2 = super().clean_new_password2()
-
-        # Blocking reuse of the current password
-        if self.user and self.user.check_password(new_password2):
-            raise forms.ValidationError("New password must be different from your current password.")
-
-        return new_password2
+        # Reuse of the current password is blocked by
+        # accounts.validators.NotCurrentPasswordValidator (AUTH_PASSWORD_VALIDATORS)
     
 
+def with_bootstrap_classes(form_class):
+    """
+    Class decorator: set Bootstrap widget classes once on base_fields.
+    Each form instance deep-copies base_fields, so the attrs carry over without per-init work.
+    """
+    for f in form_class.base_fields.values():
+        if isinstance(f.widget, forms.CheckboxInput):
+            f.widget.attrs.setdefault("class", "custom-control-input")
+        elif isinstance(f.widget, (forms.FileInput,)):
+            f.widget.attrs.setdefault("class", "form-control-file")
+        else:
+            f.widget.attrs.setdefault("class", "form-control")
+    return form_class
+
+
+@with_bootstrap_classes
 class FamilyMemberForm(forms.ModelForm):
     # give blood group a dropdown
     blood_group = forms.ChoiceField(
-        choices=[("", "— Select —")] + list(UserProfile.BLOOD_GROUPS),
+        choices=FAMILY_BLOOD_GROUP_CHOICES,
         required=False,
     )
 
@@ -91,23 +140,12 @@ class FamilyMemberForm(forms.ModelForm):
             "latitude": forms.NumberInput(attrs={"step": "0.000001"}),
             "longitude": forms.NumberInput(attrs={"step": "0.000001"}),
         }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Bootstrap classes
-        for k, f in self.fields.items():
-            if isinstance(f.widget, forms.CheckboxInput):
-                f.widget.attrs.setdefault("class", "custom-control-input")
-            elif isinstance(f.widget, (forms.FileInput,)):
-                f.widget.attrs.setdefault("class", "form-control-file")
-            else:
-                f.widget.attrs.setdefault("class", "form-control")
-
-        self.fields["is_emergency_profile"].label = "Mark as Emergency Profile"
-        self.fields["is_emergency_profile"].help_text = (
-            "Emergency profiles can be used for one-click emergency blood requests."
-        )
+        labels = {
+            "is_emergency_profile": "Mark as Emergency Profile",
+        }
+        help_texts = {
+            "is_emergency_profile": "Emergency profiles can be used for one-click emergency blood requests.",
+        }
 
     def clean(self):
         cleaned = super().clean()
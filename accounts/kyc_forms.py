@@ -2,12 +2,13 @@
 import os
 from django import forms
 from django.core.exceptions import ValidationError
-from PIL import Image  # Pillow is already needed for your ImageField
 
 from .models import KYCProfile
 
 MAX_UPLOAD_MB = 5
 ALLOWED_ID_TYPES = {"Citizenship", "Passport", "Driving License", "National ID"}
+IMAGE_FORMATS = ("JPEG", "PNG")
+IMG_EXTS = frozenset({"jpg", "jpeg", "png"})
 
 def _ext(name: str) -> str:
     return os.path.splitext(name)[1].lower().lstrip(".")
@@ -17,19 +18,50 @@ def validate_size(f):
         raise ValidationError(f"File too large. Max {MAX_UPLOAD_MB}MB.")
 
 def validate_image_file(f):
-    # Verify it is really an image (not just renamed file)
+    # Verify it is really an image (not just renamed file) and not truncated/corrupt,
+    # so a bad upload is reported on its own field. verify() checks the file's
+    # structure/checksums without a full pixel decode.
+    from PIL import Image  # imported on first use, not at form-module import
+
     try:
-        img = Image.open(f)
-        img.verify()
+        f.seek(0)
+        with Image.open(f, formats=IMAGE_FORMATS) as img:
+            img.verify()
     except Exception:
         raise ValidationError("Invalid image file. Upload a clear JPG/PNG image.")
+    finally:
+        f.seek(0)
 
-def validate_pdf_file(f):
+def validate_pdf_file(f, ext=None):
     # Basic check (content_type can vary by browser)
-    ext = _ext(f.name)
+    if ext is None:
+        ext = _ext(f.name)
     if ext != "pdf":
         raise ValidationError("Only PDF allowed for this document.")
 
+# field -> (kind, required, label); kind is "image" or "image_or_pdf"
+UPLOAD_SPEC = {
+    "id_front": ("image", True, "ID front"),
+    "id_back": ("image", False, "ID back"),
+    "selfie": ("image", True, "Selfie"),
+    "address_proof": ("image_or_pdf", False, "Address proof"),
+}
+
+# whole multipart body: every upload at the size cap + 1MB for text fields/boundaries
+MAX_REQUEST_BYTES = len(UPLOAD_SPEC) * MAX_UPLOAD_MB * 1024 * 1024 + 1024 * 1024
+
+def _validate_upload(f, kind):
+    validate_size(f)
+    ext = _ext(f.name)  # computed once per file
+    if ext in IMG_EXTS:
+        validate_image_file(f)
+    elif kind == "image_or_pdf" and ext == "pdf":
+        validate_pdf_file(f, ext)
+    elif kind == "image_or_pdf":
+        raise ValidationError("Only JPG/PNG/PDF allowed.")
+    else:
+        raise ValidationError("Only JPG/PNG allowed.")
+
 class KYCProfileForm(forms.ModelForm):
     class Meta:
         model = KYCProfile
@@ -76,47 +108,16 @@ class KYCUploadForm(forms.Form):
     def clean(self):
         cleaned = super().clean()
 
-        id_front = cleaned.get("id_front")
-        selfie = cleaned.get("selfie")
-        id_back = cleaned.get("id_back")
-        address_proof = cleaned.get("address_proof")
-
-        # Required files
-        if not id_front:
-            self.add_error("id_front", "ID front is required.")
-        if not selfie:
-            self.add_error("selfie", "Selfie is required.")
-
-        # Validate required image files
-        for field_name in ["id_front", "selfie"]:
+        # Single pass over the upload spec; each file is validated once per clean()
+        for field_name, (kind, required, label) in UPLOAD_SPEC.items():
             f = cleaned.get(field_name)
             if not f:
+                if required:
+                    self.add_error(field_name, f"{label} is required.")
                 continue
-            validate_size(f)
-            ext = _ext(f.name)
-            if ext not in {"jpg", "jpeg", "png"}:
-                self.add_error(field_name, "Only JPG/PNG allowed.")
-                continue
-            validate_image_file(f)
-
-        # Optional: id_back must be image if provided
-        if id_back:
-            validate_size(id_back)
-            ext = _ext(id_back.name)
-            if ext not in {"jpg", "jpeg", "png"}:
-                self.add_error("id_back", "Only JPG/PNG allowed.")
-            else:
-                validate_image_file(id_back)
-
-        # Optional: address proof can be image OR pdf
-        if address_proof:
-            validate_size(address_proof)
-            ext = _ext(address_proof.name)
-            if ext in {"jpg", "jpeg", "png"}:
-                validate_image_file(address_proof)
-            elif ext == "pdf":
-                validate_pdf_file(address_proof)
-            else:
-                self.add_error("address_proof", "Only JPG/PNG/PDF allowed.")
-
-        return cleaned
\ No newline at end of file
+            try:
+                _validate_upload(f, kind)
+            except ValidationError as e:
+                self.add_error(field_name, e)
+
+        return cleaned
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# Trigram GIN indexes backing the admin search_fields (icontains -> ILIKE '%term%').
+# pg_trgm is PostgreSQL-only; on other backends (local sqlite) this is a no-op.
+TRGM_INDEXES = (
+    ("accounts_user_username_trgm", "accounts_customuser", "username"),
+    ("accounts_user_email_trgm", "accounts_customuser", "email"),
+    ("accounts_kyc_id_number_trgm", "accounts_kycprofile", "id_number"),
+    ("accounts_family_name_trgm", "accounts_familymember", "name"),
+    ("accounts_family_city_trgm", "accounts_familymember", "city"),
+)
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_customuser_lower_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_admin_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='kycprofile',
+            name='status',
+            field=models.CharField(choices=[('NOT_SUBMITTED', 'Not Submitted'), ('PENDING', 'Pending Review'), ('APPROVED', 'Approved'), ('REJECTED', 'Rejected')], db_index=True, default='NOT_SUBMITTED', max_length=20),
+        ),
+    ]
@@ -0,0 +1,68 @@
+from django.db import migrations
+
+
+# Keep accounts_customuser.is_verified in sync with the KYC status inside the database,
+# so every status change (admin save, bulk queryset.update, shell) updates the user
+# in the same statement/transaction without a second round-trip from Python.
+
+PG_CREATE = (
+    """
+    CREATE OR REPLACE FUNCTION accounts_sync_user_verified() RETURNS trigger AS $$
+    BEGIN
+        UPDATE accounts_customuser SET is_verified = (NEW.status = 'APPROVED') WHERE id = NEW.user_id;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified ON accounts_kycprofile",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION accounts_sync_user_verified()
+    """,
+)
+PG_DROP = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified ON accounts_kycprofile",
+    "DROP FUNCTION IF EXISTS accounts_sync_user_verified()",
+)
+
+SQLITE_CREATE = (
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE accounts_customuser SET is_verified = (NEW.status = 'APPROVED') WHERE id = NEW.user_id;
+    END
+    """,
+)
+SQLITE_DROP = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified",
+)
+
+
+def _run(schema_editor, statements_by_vendor):
+    for sql in statements_by_vendor.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(sql)
+
+
+def create_trigger(apps, schema_editor):
+    _run(schema_editor, {"postgresql": PG_CREATE, "sqlite": SQLITE_CREATE})
+
+
+def drop_trigger(apps, schema_editor):
+    _run(schema_editor, {"postgresql": PG_DROP, "sqlite": SQLITE_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_kycprofile_status_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0 on 2026-10-16 19:59
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_no_ci_duplicates(apps, schema_editor):
+    # User accounts are never merged/deleted automatically; list the clashes
+    # so they can be resolved by hand before the constraints are added.
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    clashes = []
+    for field, qs in (
+        ("username", CustomUser.objects.all()),
+        ("email", CustomUser.objects.exclude(email="")),
+    ):
+        dupes = (
+            qs.annotate(v=Lower(field)).values("v")
+            .annotate(n=Count("id")).filter(n__gt=1)
+            .values_list("v", flat=True)
+        )
+        clashes += [f"{field}={v!r}" for v in dupes]
+    if clashes:
+        raise RuntimeError(
+            "Case-insensitive duplicate users must be resolved before adding unique constraints: "
+            + ", ".join(clashes)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0009_kyc_status_sync_user_verified_trigger'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_no_ci_duplicates, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='customuser',
+            name='accounts_user_uname_lower_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='uniq_user_username_ci'),
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), condition=models.Q(('email', ''), _negated=True), name='uniq_user_email_ci'),
+        ),
+    ]
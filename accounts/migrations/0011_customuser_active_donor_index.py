@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0010_customuser_ci_unique_constraints'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_donor', True)), fields=['id'], name='accounts_user_active_donor_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 20:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_customuser_active_donor_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['blood_group', 'city_canon', '-points'], name='accounts_up_directory_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.db import migrations
+from django.db.models import Max
+
+
+# The donor directory now filters on UserProfile.last_verified_donation_at instead of
+# aggregating blood donations per request; fill it (and next_eligible_at) for existing
+# donors. Later changes are kept in sync by blood.signals.
+
+ELIGIBILITY_DAYS = 90  # blood.eligibility.ELIGIBILITY_DAYS at the time of writing
+
+
+def backfill(apps, schema_editor):
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    BloodDonation = apps.get_model("blood", "BloodDonation")
+
+    latest = (
+        BloodDonation.objects
+        .filter(status="VERIFIED", donor_user__isnull=False)
+        .order_by()
+        .values_list("donor_user")
+        .annotate(m=Max("donated_at"))
+    )
+    UserProfile.objects.update(last_verified_donation_at=None, next_eligible_at=None)
+    for user_id, last in latest.iterator():
+        UserProfile.objects.filter(user_id=user_id).update(
+            last_verified_donation_at=last,
+            next_eligible_at=last + timedelta(days=ELIGIBILITY_DAYS),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_userprofile_directory_index'),
+        ('blood', '0014_blooddonation_blood_blood_donor_u_442cea_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+# city_canon was added (0005) without filling existing rows; the donor directory
+# now filters on it alone instead of OR-ing city__iexact per alias, so make sure
+# every profile has it. UserProfile.save() keeps it in sync from here on.
+
+def backfill(apps, schema_editor):
+    from blood.matching import canonical_city
+
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    stale = []
+    for p in UserProfile.objects.only("id", "city", "city_canon").iterator():
+        canon = canonical_city(p.city or "")
+        if p.city_canon != canon:
+            p.city_canon = canon
+            stale.append(p)
+    UserProfile.objects.bulk_update(stale, ["city_canon"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_backfill_donor_eligibility_cache'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-16 20:18
+
+from django.db import migrations, models
+
+
+# UserProfile.COMPLETION_FIELDS at the time of writing (historical models don't
+# carry class attributes)
+COMPLETION_FIELDS = (
+    "blood_group", "city", "date_of_birth",
+    "emergency_contact_name", "emergency_contact_phone",
+    "address_line", "country",
+)
+
+
+def backfill(apps, schema_editor):
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    stale = []
+    for p in UserProfile.objects.only("id", "completion_percent", *COMPLETION_FIELDS).iterator():
+        done = sum(1 for f in COMPLETION_FIELDS if getattr(p, f))
+        percent = int((done / len(COMPLETION_FIELDS)) * 100)
+        if p.completion_percent != percent:
+            p.completion_percent = percent
+            stale.append(p)
+    UserProfile.objects.bulk_update(stale, ["completion_percent"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_backfill_userprofile_city_canon'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='completion_percent',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
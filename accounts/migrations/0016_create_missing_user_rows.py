@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+# ensure_user_rows (accounts.models) only runs when a user is created; it no longer
+# repairs users on later saves. Give every existing user without a profile / KYC row
+# (created before the receiver, or via bulk_create/fixtures) the rows that views
+# like profile_view and the certificate read directly.
+
+def create_missing(apps, schema_editor):
+    CustomUser = apps.get_model("accounts", "CustomUser")
+    UserProfile = apps.get_model("accounts", "UserProfile")
+    KYCProfile = apps.get_model("accounts", "KYCProfile")
+
+    no_profile = CustomUser.objects.filter(profile__isnull=True).values_list("id", flat=True)
+    UserProfile.objects.bulk_create(
+        [UserProfile(user_id=uid) for uid in no_profile.iterator()],
+        batch_size=500,
+    )
+
+    # inserts only: the KYC -> is_verified trigger (0009) fires on status UPDATEs
+    no_kyc = CustomUser.objects.filter(kyc__isnull=True).values_list("id", flat=True)
+    KYCProfile.objects.bulk_create(
+        [KYCProfile(user_id=uid) for uid in no_kyc.iterator()],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_userprofile_completion_percent'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_missing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,98 @@
+from django.db import migrations
+
+
+# Follow-up to 0009 (accounts_sync_user_verified() is reused as-is on PostgreSQL):
+# - a KYCProfile inserted as APPROVED (admin, fixtures) now marks the user verified too;
+#   other inserts leave is_verified alone, so creating the NOT_SUBMITTED row for a new
+#   user never clears a flag set elsewhere
+# - moving to PENDING (a user resubmitting) no longer touches is_verified; the flag only
+#   changes when the review decides (APPROVED -> True, REJECTED/NOT_SUBMITTED -> False)
+
+PG_CREATE = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified ON accounts_kycprofile",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status AND NEW.status <> 'PENDING')
+    EXECUTE FUNCTION accounts_sync_user_verified()
+    """,
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified_insert ON accounts_kycprofile",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified_insert
+    AFTER INSERT ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN (NEW.status = 'APPROVED')
+    EXECUTE FUNCTION accounts_sync_user_verified()
+    """,
+)
+PG_DROP = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified_insert ON accounts_kycprofile",
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified ON accounts_kycprofile",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION accounts_sync_user_verified()
+    """,
+)
+
+SQLITE_CREATE = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN OLD.status IS NOT NEW.status AND NEW.status <> 'PENDING'
+    BEGIN
+        UPDATE accounts_customuser SET is_verified = (NEW.status = 'APPROVED') WHERE id = NEW.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS accounts_kyc_sync_verified_insert
+    AFTER INSERT ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN NEW.status = 'APPROVED'
+    BEGIN
+        UPDATE accounts_customuser SET is_verified = 1 WHERE id = NEW.user_id;
+    END
+    """,
+)
+SQLITE_DROP = (
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified_insert",
+    "DROP TRIGGER IF EXISTS accounts_kyc_sync_verified",
+    """
+    CREATE TRIGGER accounts_kyc_sync_verified
+    AFTER UPDATE OF status ON accounts_kycprofile
+    FOR EACH ROW
+    WHEN OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE accounts_customuser SET is_verified = (NEW.status = 'APPROVED') WHERE id = NEW.user_id;
+    END
+    """,
+)
+
+
+def _run(schema_editor, statements_by_vendor):
+    for sql in statements_by_vendor.get(schema_editor.connection.vendor, ()):
+        schema_editor.execute(sql)
+
+
+def create_triggers(apps, schema_editor):
+    _run(schema_editor, {"postgresql": PG_CREATE, "sqlite": SQLITE_CREATE})
+
+
+def restore_0009_trigger(apps, schema_editor):
+    _run(schema_editor, {"postgresql": PG_DROP, "sqlite": SQLITE_DROP})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_create_missing_user_rows'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, restore_0009_trigger),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.db.models.signals import post_save
 from django.utils import timezone
 from django.core.validators import FileExtensionValidator
@@ -21,6 +23,29 @@ class CustomUser(AbstractUser):
     phone_number = models.CharField(max_length=15, blank=True)
     profile_image = models.ImageField(upload_to='profile_pics/', blank=True, null=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # case-insensitive email lookups (registration, login fallback);
+            # the unique constraint below is partial, so it cannot serve them
+            models.Index(Lower("email"), name="accounts_user_email_lower_idx"),
+            # donor matching / directory / reminders all filter is_active AND is_donor;
+            # partial, so only donor rows are indexed (PostgreSQL and SQLite)
+            models.Index(
+                fields=["id"],
+                condition=Q(is_active=True, is_donor=True),
+                name="accounts_user_active_donor_idx",
+            ),
+        ]
+        constraints = [
+            # DB-enforced case-insensitive uniqueness (closes the check-then-insert race)
+            models.UniqueConstraint(Lower("username"), name="uniq_user_username_ci"),
+            models.UniqueConstraint(
+                Lower("email"),
+                condition=~Q(email=""),
+                name="uniq_user_email_ci",
+            ),
+        ]
+
     def __str__(self):
         return self.username
     
@@ -83,6 +108,20 @@ class UserProfile(models.Model):
     emergency_contact_name = models.CharField(max_length=120, blank=True)
     emergency_contact_phone = models.CharField(max_length=30, blank=True)
 
+    # Profile completion (percent of COMPLETION_FIELDS filled), kept by save()
+    COMPLETION_FIELDS = (
+        "blood_group", "city", "date_of_birth",
+        "emergency_contact_name", "emergency_contact_phone",
+        "address_line", "country",
+    )
+    completion_percent = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # public donor directory: blood group (+ canonical city) filter, points-desc order
+            models.Index(fields=["blood_group", "city_canon", "-points"], name="accounts_up_directory_idx"),
+        ]
+
     def save(self, *args, **kwargs):
         # Always compute canonical city
         try:
@@ -96,8 +135,22 @@ class UserProfile(models.Model):
         if update_fields is not None:
             kwargs["update_fields"] = list(set(update_fields) | {"city_canon"})
 
+        # Recompute completion only when a counted field may have changed
+        # (partial saves like points=... skip it and never touch deferred fields)
+        if update_fields is None or not set(update_fields).isdisjoint(self.COMPLETION_FIELDS):
+            self.completion_percent = self.compute_completion_percent()
+            if update_fields is not None:
+                kwargs["update_fields"].append("completion_percent")
+
         super().save(*args, **kwargs)
 
+    def compute_completion_percent(self) -> int:
+        done = sum(1 for f in self.COMPLETION_FIELDS if getattr(self, f))
+        return int((done / len(self.COMPLETION_FIELDS)) * 100)
+
+    def missing_completion_fields(self):
+        return [f for f in self.COMPLETION_FIELDS if not getattr(self, f)]
+
     def __str__(self):
         return f"Profile of {self.user.username}"
     
@@ -142,7 +195,7 @@ class KYCProfile(models.Model):
     )
 
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="kyc")
-    status = models.CharField(max_length=20, choices=STATUS, default="NOT_SUBMITTED")
+    status = models.CharField(max_length=20, choices=STATUS, default="NOT_SUBMITTED", db_index=True)
 
     # Basic KYC info
     full_name = models.CharField(max_length=150, blank=True)
@@ -194,12 +247,14 @@ class KYCDocument(models.Model):
 
 # --- SIGNALS (AUTOMATICALLY CREATE PROFILE) ---
 
-@receiver(post_save, sender=CustomUser, dispatch_uid="accounts.ensure_profile")
-def ensure_profile(sender, instance, created, **kwargs):
-    # create if missing (safe even if signal fires twice)
-    UserProfile.objects.get_or_create(user=instance)
-
-@receiver(post_save, sender=CustomUser, dispatch_uid="accounts.ensure_kyc")
-def ensure_kyc(sender, instance, created, **kwargs):
-    # create if missing (safe even if signal fires twice)
-    KYCProfile.objects.get_or_create(user=instance)
\ No newline at end of file
+@receiver(post_save, sender=CustomUser, dispatch_uid="accounts.ensure_user_rows")
+def ensure_user_rows(sender, instance, created, **kwargs):
+    # only on creation: plain user updates (last_login, flags) must not re-query profile/KYC
+    if not created:
+        return
+    # the user row was just inserted, so neither dependent row can exist yet:
+    # plain INSERTs, no SELECT probes (dispatch_uid keeps this single-registered).
+    # Not deferred to on_commit: callers like register() use user.profile in the
+    # same transaction, and a rollback discards these rows along with the user.
+    UserProfile.objects.create(user=instance)
+    KYCProfile.objects.create(user=instance)
@@ -0,0 +1,49 @@
+# accounts/password_reset_urls.py
+# Forgot-password flow, mounted under "password-reset/" by accounts/urls.py so
+# resolve() skips the whole group with one prefix test for every other URL.
+from django.urls import path
+from django.contrib.auth import views as auth_views
+
+from core.utils.urls import cached_reverse_lazy
+
+from .forms import BootstrapPasswordResetForm, BootstrapSetPasswordForm
+
+
+# success URLs: cached_reverse_lazy resolves each name once per process
+# (reverse_lazy re-runs reverse() on every password-reset POST)
+urlpatterns = [
+    path(
+        "",
+        auth_views.PasswordResetView.as_view(
+            template_name="accounts/password_reset_form.html",
+            email_template_name="accounts/emails/password_reset_email.txt",
+            subject_template_name="accounts/emails/password_reset_subject.txt",
+            success_url=cached_reverse_lazy("password_reset_done"),
+            form_class=BootstrapPasswordResetForm,
+        ),
+        name="password_reset",
+    ),
+    path(
+        "done/",
+        auth_views.PasswordResetDoneView.as_view(
+            template_name="accounts/password_reset_done.html",
+        ),
+        name="password_reset_done",
+    ),
+    path(
+        "complete/",
+        auth_views.PasswordResetCompleteView.as_view(
+            template_name="accounts/password_reset_complete.html",
+        ),
+        name="password_reset_complete",
+    ),
+    path(
+        "<uidb64>/<token>/",
+        auth_views.PasswordResetConfirmView.as_view(
+            template_name="accounts/password_reset_confirm.html",
+            success_url=cached_reverse_lazy("password_reset_complete"),
+            form_class=BootstrapSetPasswordForm,
+        ),
+        name="password_reset_confirm",
+    ),
+]
@@ -2,24 +2,21 @@ from functools import wraps
 from django.contrib import messages
 from django.shortcuts import redirect
 
-def donor_required(view_func):
-    @wraps(view_func)
-    def _wrapped(request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            return redirect("login")
-        if not getattr(request.user, "is_donor", False):
-            messages.warning(request, "Enable Donor role in your profile to access this feature.")
-            return redirect("profile_edit")
-        return view_func(request, *args, **kwargs)
-    return _wrapped
+def _role_required(role_attr, role_label):
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped(request, *args, **kwargs):
+            # resolve the lazy user once; stacked decorators reuse the same
+            # loaded instance (SimpleLazyObject caches it on the request)
+            user = request.user
+            if not user.is_authenticated:
+                return redirect("login")
+            if not getattr(user, role_attr, False):
+                messages.warning(request, f"Enable {role_label} role in your profile to access this feature.")
+                return redirect("profile_edit")
+            return view_func(request, *args, **kwargs)
+        return _wrapped
+    return decorator
 
-def recipient_required(view_func):
-    @wraps(view_func)
-    def _wrapped(request, *args, **kwargs):
-        if not request.user.is_authenticated:
-            return redirect("login")
-        if not getattr(request.user, "is_recipient", False):
-            messages.warning(request, "Enable Recipient role in your profile to access this feature.")
-            return redirect("profile_edit")
-        return view_func(request, *args, **kwargs)
-    return _wrapped
\ No newline at end of file
+donor_required = _role_required("is_donor", "Donor")
+recipient_required = _role_required("is_recipient", "Recipient")
@@ -1,9 +1,22 @@
-from django.db.models.signals import pre_save, post_delete
+from django.core.cache import cache
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 
+from blood.models import BloodDonation, PublicBloodRequest
 from core.utils.file_cleanup import cleanup_replaced_file, cleanup_file_on_delete
+from crowdfunding.models import Campaign, Donation
+from hospitals.models import BloodCampaign
+from organ.models import OrganPledge
 from .models import CustomUser, KYCDocument
 
+# cached context of the home page (accounts.views.home)
+HOME_CONTEXT_CACHE_KEY = "home_ctx_v1"
+
+
+def profile_stats_cache_key(user_id):
+    # crowdfunding / impact aggregates shown on accounts.views.profile_view
+    return f"user:{user_id}:profile_stats"
+
 
 # --- Profile image cleanup ---
 @receiver(pre_save, sender=CustomUser)
@@ -24,4 +37,32 @@ def kyc_doc_cleanup_on_change(sender, instance, **kwargs):
 
 @receiver(post_delete, sender=KYCDocument)
 def kyc_doc_cleanup_on_delete(sender, instance, **kwargs):
-    cleanup_file_on_delete(instance, "file")
\ No newline at end of file
+    cleanup_file_on_delete(instance, "file")
+
+
+# --- Home page cache: drop it when anything it shows changes ---
+# (queryset.update() bypasses signals; the short TTL in views.home covers that)
+@receiver(post_save, sender=PublicBloodRequest)
+@receiver(post_delete, sender=PublicBloodRequest)
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+@receiver(post_save, sender=BloodCampaign)
+@receiver(post_delete, sender=BloodCampaign)
+def invalidate_home_context(sender, **kwargs):
+    cache.delete(HOME_CONTEXT_CACHE_KEY)
+
+
+# --- Profile stats cache: drop a donor's entry when one of their donations/pledges changes ---
+@receiver(post_save, sender=Donation)
+@receiver(post_delete, sender=Donation)
+@receiver(post_save, sender=BloodDonation)
+@receiver(post_delete, sender=BloodDonation)
+def invalidate_profile_stats(sender, instance, **kwargs):
+    if instance.donor_user_id:
+        cache.delete(profile_stats_cache_key(instance.donor_user_id))
+
+
+@receiver(post_save, sender=OrganPledge)
+@receiver(post_delete, sender=OrganPledge)
+def invalidate_profile_stats_organ(sender, instance, **kwargs):
+    cache.delete(profile_stats_cache_key(instance.donor_id))
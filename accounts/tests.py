@@ -1,3 +1,312 @@
-from django.test import TestCase
+import io
+import os
+import re
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core import signing
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse, Resolver404
+from PIL import Image
+
+from blood.models import BloodDonation
+from crowdfunding.models import Campaign, Donation
+from organ.models import OrganPledge
+
+from .converters import SignedTokenConverter
+from .forms import RegistrationForm
+from .models import CustomUser, KYCDocument, KYCProfile, UserProfile
+from .tokens import EMAIL_VERIFY_SALT, make_email_token
+
+
+class RecalculatePointsTests(TestCase):
+    """
+    The grouped-query command must give the same totals as the old per-user loop:
+    KYC approved +200, verified blood 150 + 20*units each, verified pledge +150 each,
+    successful crowdfunding amount // 100 floored per donation.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.kyc_blood, cls.organ, cls.funder, cls.nobody = [
+            CustomUser.objects.create(username=f"u{i}") for i in range(4)
+        ]
+        KYCProfile.objects.filter(user=cls.kyc_blood).update(status="APPROVED")
+
+        # bulk_create: no post_save signals, so points start from 0
+        BloodDonation.objects.bulk_create([
+            BloodDonation(donor_user=cls.kyc_blood, units=2, status="VERIFIED"),
+            BloodDonation(donor_user=cls.kyc_blood, units=1, status="VERIFIED"),
+            BloodDonation(donor_user=cls.organ, units=3, status="COMPLETED"),
+            BloodDonation(donor_user=None, units=3, status="VERIFIED"),
+        ])
+        OrganPledge.objects.bulk_create([
+            OrganPledge(donor=cls.organ, status="VERIFIED"),
+            OrganPledge(donor=cls.organ, status="VERIFIED"),
+            OrganPledge(donor=cls.funder, status="DRAFT"),
+        ])
+        campaign = Campaign.objects.create(
+            owner=cls.nobody, title="Test", target_amount=1000, deadline="2030-01-01"
+        )
+        Donation.objects.bulk_create([
+            Donation(campaign=campaign, donor_user=cls.funder, amount=Decimal("199.99"), gateway="KHALTI", status="SUCCESS"),
+            Donation(campaign=campaign, donor_user=cls.funder, amount=Decimal("150.50"), gateway="KHALTI", status="SUCCESS"),
+            Donation(campaign=campaign, donor_user=cls.nobody, amount=Decimal("10000"), gateway="KHALTI", status="FAILED"),
+        ])
+        UserProfile.objects.update(points=0)
+
+    expected = {"u0": 560, "u1": 300, "u2": 2, "u3": 0}
+
+    def points(self):
+        return dict(UserProfile.objects.values_list("user__username", "points"))
+
+    def test_totals_match_per_user_rules(self):
+        call_command("recalculate_points", stdout=io.StringIO())
+        self.assertEqual(self.points(), self.expected)
+
+    def test_crowdfunding_is_floored_per_donation(self):
+        # 199.99 + 150.50 -> 1 + 1, not floor(350.49 / 100) == 3
+        call_command("recalculate_points", user=self.funder.pk, stdout=io.StringIO())
+        self.assertEqual(UserProfile.objects.get(user=self.funder).points, 2)
+
+    def test_user_filter_only_touches_that_user(self):
+        call_command("recalculate_points", user=self.organ.pk, stdout=io.StringIO())
+        self.assertEqual(self.points(), {"u0": 0, "u1": 300, "u2": 0, "u3": 0})
+
+    def test_dry_run_prints_without_saving(self):
+        out = io.StringIO()
+        call_command("recalculate_points", dry_run=True, stdout=out)
+
+        self.assertEqual(set(self.points().values()), {0})
+        for username, pts in self.expected.items():
+            self.assertIn(f"{username} points={pts}", out.getvalue())
+
+    def test_second_run_updates_nothing(self):
+        call_command("recalculate_points", stdout=io.StringIO())
+        out = io.StringIO()
+        call_command("recalculate_points", stdout=out)
+        self.assertIn("Updated profiles: 0", out.getvalue())
+
+
+class RegistrationTests(TestCase):
+    def form_data(self, **extra):
+        data = {
+            "first_name": "Reg",
+            "last_name": "Tester",
+            "username": "reg",
+            "email": "reg@example.com",
+            "password": "pass12345",
+            "confirm_password": "pass12345",
+            "phone": "9800000000",
+            "city": "Kathmandu",
+        }
+        data.update(extra)
+        return data
+
+    def test_long_username_reports_one_length_error(self):
+        form = RegistrationForm(self.form_data(username="a" * 151))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(len(form.errors["username"]), 1)
+
+    def test_invalid_username_characters_are_rejected(self):
+        form = RegistrationForm(self.form_data(username="bad name!"))
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("username", form.errors)
+
+    def test_duplicate_email_race_becomes_field_error(self):
+        CustomUser.objects.create_user(username="first", email="Reg@Example.com", password="pass12345")
+
+        # simulate a concurrent registration landing between clean() and save()
+        with mock.patch.object(RegistrationForm, "clean", lambda form: form.cleaned_data):
+            response = self.client.post(reverse("register"), self.form_data())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["form"].errors["email"], ["Email is already registered"])
+        shown = [str(m) for m in response.context["messages"]]
+        self.assertEqual(shown, ["email: Email is already registered"])
+        self.assertFalse(CustomUser.objects.filter(username="reg").exists())
+
+
+class VerifyEmailRouteTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username="ver", email="Ver@Example.com", password="pass12345")
+
+    def test_converter_matches_signer_output(self):
+        pattern = re.compile(rf"^{SignedTokenConverter.regex}$")
+        self.assertRegex(make_email_token(self.user), pattern)
+        # compressed payloads start with "."
+        compressed = signing.dumps({"uid": 1, "email": "a" * 200}, salt=EMAIL_VERIFY_SALT, compress=True)
+        self.assertTrue(compressed.startswith("."))
+        self.assertRegex(compressed, pattern)
+
+        for value in ("resend", "send", "abc", "a:b:c", "x" * 40):
+            self.assertIsNone(pattern.match(value), value)
+
+    def test_static_routes_are_not_shadowed(self):
+        self.assertEqual(resolve("/accounts/verify-email/resend/").url_name, "resend_verification_email_public")
+        self.assertEqual(resolve("/accounts/verify-email/send/").url_name, "send_verification_email")
+        self.assertEqual(resolve("/accounts/verify-email/").url_name, "verify_email_prompt")
+
+    def test_non_token_path_404s(self):
+        with self.assertRaises(Resolver404):
+            resolve("/accounts/verify-email/not-a-token/")
+
+    def test_valid_token_verifies_email(self):
+        url = reverse("verify_email", args=[make_email_token(self.user)])
+        response = self.client.get(url)
+
+        self.assertRedirects(response, reverse("login"), fetch_redirect_response=False)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.email_verified)
+
+    def test_tampered_token_is_rejected(self):
+        token = make_email_token(self.user)
+        response = self.client.get(reverse("verify_email", args=[token[:-1] + ("A" if token[-1] != "A" else "B")]))
+
+        self.assertEqual(response.status_code, 400)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.email_verified)
+
+    def test_token_for_old_email_is_rejected(self):
+        token = make_email_token(self.user)
+        CustomUser.objects.filter(pk=self.user.pk).update(email="new@example.com")
+
+        response = self.client.get(reverse("verify_email", args=[token]))
+        self.assertEqual(response.status_code, 400)
+
+
+def png_upload(name):
+    buf = io.BytesIO()
+    Image.new("RGB", (10, 10), "red").save(buf, "PNG")
+    return SimpleUploadedFile(name, buf.getvalue(), content_type="image/png")
+
+
+class KYCSubmitTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = CustomUser.objects.create_user(username="kyc", email="kyc@example.com", password="pass12345")
+        self.client.force_login(self.user)
+        self.url = reverse("kyc_submit")
+
+    def post_kyc(self, **extra):
+        data = {
+            "full_name": "Kay Tester",
+            "id_type": "Passport",
+            "id_number": "AB123456",
+            "id_front": png_upload("front.png"),
+            "selfie": png_upload("selfie.png"),
+        }
+        data.update(extra)
+        return self.client.post(self.url, data)
+
+    def stored_files(self):
+        return dict(KYCDocument.objects.filter(kyc__user=self.user).values_list("doc_type", "file"))
+
+    def exists(self, name):
+        return os.path.exists(os.path.join(self.media_root, name))
+
+    def test_submit_saves_documents_and_marks_pending(self):
+        response = self.post_kyc()
+
+        self.assertRedirects(response, reverse("profile"), fetch_redirect_response=False)
+        kyc = KYCProfile.objects.get(user=self.user)
+        self.assertEqual(kyc.status, "PENDING")
+        self.assertIsNotNone(kyc.submitted_at)
+
+        files = self.stored_files()
+        self.assertEqual(set(files), {"ID_FRONT", "SELFIE"})
+        self.assertTrue(all(self.exists(name) for name in files.values()))
+
+    def test_resubmit_replaces_rows_and_deletes_old_files_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_kyc()
+        first_ids = dict(KYCDocument.objects.values_list("doc_type", "id"))
+        old = self.stored_files()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_kyc(address_proof=png_upload("address.png"))
+
+        new = self.stored_files()
+        self.assertEqual(set(new), {"ID_FRONT", "SELFIE", "ADDRESS_PROOF"})
+        # upsert keeps the existing rows, one per (kyc, doc_type)
+        self.assertEqual(KYCDocument.objects.count(), 3)
+        for doc_type, pk in first_ids.items():
+            self.assertEqual(KYCDocument.objects.get(doc_type=doc_type).pk, pk)
+
+        for doc_type, name in old.items():
+            self.assertNotEqual(new[doc_type], name)
+            self.assertFalse(self.exists(name))
+        self.assertTrue(all(self.exists(name) for name in new.values()))
+
+    def test_failed_submission_rolls_back_and_keeps_old_files(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post_kyc()
+        old = self.stored_files()
+        KYCProfile.objects.filter(user=self.user).update(status="REJECTED")
+
+        with mock.patch.object(KYCProfile, "mark_submitted", side_effect=RuntimeError("boom")):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                response = self.post_kyc(full_name="Changed Name")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.stored_files(), old)
+        self.assertTrue(all(self.exists(name) for name in old.values()))
+
+        kyc = KYCProfile.objects.get(user=self.user)
+        self.assertEqual(kyc.full_name, "Kay Tester")
+        self.assertEqual(kyc.status, "REJECTED")
+
+    def test_renamed_non_image_is_rejected(self):
+        fake = SimpleUploadedFile("front.png", b"not really an image", content_type="image/png")
+        response = self.post_kyc(id_front=fake)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(KYCDocument.objects.exists())
+        self.assertEqual(KYCProfile.objects.get(user=self.user).status, "NOT_SUBMITTED")
+
+
+class KYCVerifiedTriggerTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username="trig", email="trig@example.com", password="pass12345")
+
+    def is_verified(self):
+        self.user.refresh_from_db(fields=["is_verified"])
+        return self.user.is_verified
+
+    def set_status(self, status):
+        KYCProfile.objects.filter(user=self.user).update(status=status)
+
+    def test_status_update_syncs_user_is_verified(self):
+        self.set_status("APPROVED")
+        self.assertTrue(self.is_verified())
+
+        self.set_status("REJECTED")
+        self.assertFalse(self.is_verified())
+
+    def test_resubmission_keeps_flag_until_review(self):
+        self.set_status("APPROVED")
+        self.set_status("PENDING")
+        self.assertTrue(self.is_verified())
+
+    def test_insert_as_approved_marks_user_verified(self):
+        KYCProfile.objects.filter(user=self.user).delete()
+        KYCProfile.objects.create(user=self.user, status="APPROVED")
+        self.assertTrue(self.is_verified())
+
+    def test_insert_not_submitted_keeps_existing_flag(self):
+        CustomUser.objects.filter(pk=self.user.pk).update(is_verified=True)
+        KYCProfile.objects.filter(user=self.user).delete()
+        KYCProfile.objects.create(user=self.user)
+        self.assertTrue(self.is_verified())
@@ -5,6 +5,13 @@ EMAIL_VERIFY_SALT = "accounts.EmailVerify.v1"
 def make_email_token(user) -> str:
     return signing.dumps({"uid": user.pk, "email": user.email}, salt=EMAIL_VERIFY_SALT)
 
+def make_dummy_email_token(email: str) -> str:
+    # Same signing work as make_email_token, for lookups that found no user,
+    # so the response time does not reveal whether an account exists.
+    return signing.dumps({"uid": 0, "email": email}, salt=EMAIL_VERIFY_SALT)
+
 def read_email_token(token: str, max_age_seconds: int = 60 * 60 * 24):
+    # signature check is constant-time; callers comparing the decoded fields
+    # against DB values must use django.utils.crypto.constant_time_compare too
     # default: 24 hours
     return signing.loads(token, salt=EMAIL_VERIFY_SALT, max_age=max_age_seconds)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from django.core.exceptions import ValidationError
+
+
+class NotCurrentPasswordValidator:
+    """
+    Reject a new password that equals the user's current one.
+    Runs through validate_password(), i.e. once per form and only after the
+    two password fields matched (no extra hashing round on a mismatch).
+    """
+
+    def validate(self, password, user=None):
+        if user is not None and user.pk and user.check_password(password):
+            raise ValidationError(
+                "New password must be different from your current password.",
+                code="password_reused",
+            )
+
+    def get_help_text(self):
+        return "Your new password must be different from your current password."
@@ -0,0 +1,16 @@
+# accounts/verify_urls.py
+# Email verification, mounted under "verify-email/" by accounts/urls.py.
+from django.urls import path, register_converter
+
+from . import views
+from .converters import SignedTokenConverter
+
+register_converter(SignedTokenConverter, "signed")
+
+urlpatterns = [
+    path("", views.verify_email_prompt, name="verify_email_prompt"),
+    path("send/", views.send_verification_email, name="send_verification_email"),
+    # static routes first; <signed:...> only matches signer output, so "resend" can't collide
+    path("resend/", views.resend_verification_email_public, name="resend_verification_email_public"),
+    path("<signed:token>/", views.verify_email, name="verify_email"),
+]
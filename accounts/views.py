@@ -2,12 +2,14 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.core.mail import send_mail
-from django.db import transaction
-from django.http import HttpResponseBadRequest
+from django.db import IntegrityError, transaction
+from django.http import FileResponse, HttpResponseBadRequest
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
 from datetime import timedelta
 from django.utils.http import url_has_allowed_host_and_scheme
 from blood.eligibility import (
@@ -19,25 +21,23 @@ from blood.eligibility import (
 
 from django.views.decorators.http import require_POST
 from django.core.paginator import Paginator
-from django.db.models import Max
+from django.db.models import Count, Prefetch, Q, Sum
+from django.db.models.functions import Lower
 from blood.matching import city_aliases, canonical_city
 import io
 import os
+from bisect import bisect_right
+from functools import lru_cache
 from PIL import Image
 from django.core.files.base import ContentFile
 from cloudinary.exceptions import BadRequest as CloudinaryBadRequest
-from django.http import HttpResponse
-from django.db.models import Sum
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
-from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
-from django.shortcuts import redirect
-from accounts.models import UserProfile
 from core.models import SiteSetting
+from core.utils.urls import cached_reverse
 
-from blood.models import BloodDonation
 from organ.models import OrganPledge, OrganRequest
 
 from .forms import (
@@ -48,44 +48,61 @@ from .forms import (
     UserRoleForm,
 )
 
-from django.db.models import Q
-from django.core.exceptions import FieldError
-from .kyc_forms import KYCProfileForm, KYCUploadForm
+from .kyc_forms import (
+    KYCProfileForm,
+    KYCUploadForm,
+    MAX_UPLOAD_MB as KYC_MAX_UPLOAD_MB,
+    MAX_REQUEST_BYTES as KYC_MAX_REQUEST_BYTES,
+)
 from .models import CustomUser, UserProfile, FamilyMember, KYCProfile, KYCDocument
-from .tokens import make_email_token, read_email_token
+from .signals import HOME_CONTEXT_CACHE_KEY, profile_stats_cache_key
+from .tokens import make_email_token, make_dummy_email_token, read_email_token
 
 from blood.models import PublicBloodRequest, BloodDonation
 from crowdfunding.models import Campaign, Donation
+from hospitals.models import BloodCampaign
 
 
 
 User = get_user_model()
 
-# hiding rejected requests from home page
-all_requests = (
-    PublicBloodRequest.objects
-    .filter(is_active=True)
-    .exclude(verification_status="REJECTED")
-    .order_by("-is_emergency", "-created_at")
-)
+VERIFY_EMAIL_DEBOUNCE = 120  # seconds
+
 
 def send_verification_email_to_user(request, user) -> bool:
     if not user.email:
         return False
 
+    # repeated login attempts / resend clicks: one mail per user per window.
+    # cache.add is atomic (only the first caller sets the key); the link sent
+    # moments ago is still valid, so report success without sending another
+    debounce_key = f"verify_mail:{user.pk}"
+    if not cache.add(debounce_key, 1, VERIFY_EMAIL_DEBOUNCE):
+        return True
+
     token = make_email_token(user)
     link = request.build_absolute_uri(reverse("verify_email", args=[token]))
 
-    send_mail(
-        "Share4Life - Verify your email",
-        f"Verify your Share4Life email:\n\n{link}\n\nIf you didn’t request this, ignore this email.",
-        settings.DEFAULT_FROM_EMAIL,
-        [user.email],
-        fail_silently=False,
-    )
+    # sent inline: login is refused until the email is verified, so this mail
+    # can't wait in the QueuedEmail batch queue behind broadcast mail
+    try:
+        send_mail(
+            "Share4Life - Verify your email",
+            f"Verify your Share4Life email:\n\n{link}\n\nIf you didn’t request this, ignore this email.",
+            settings.DEFAULT_FROM_EMAIL,
+            [user.email],
+            fail_silently=False,
+        )
+    except Exception:
+        # nothing was sent: release the window so the next attempt really sends
+        cache.delete(debounce_key)
+        raise
     return True
 
 
+HOME_CONTEXT_TTL = 60  # seconds
+
+
 def home(request):
     """
     Home page:
@@ -94,7 +111,14 @@ def home(request):
       - Completed / fulfilled / cancelled / rejected / unverified requests hidden
       - Home popup logic kept
       - Featured campaign logic kept
+    Context is the same for every visitor, so it is built once per HOME_CONTEXT_TTL
+    (and dropped early by accounts.signals when a request/campaign changes).
     """
+    context = cache.get_or_set(HOME_CONTEXT_CACHE_KEY, _build_home_context, HOME_CONTEXT_TTL)
+    return render(request, "core/home.html", context)
+
+
+def _build_home_context():
     today = timezone.localdate()
 
     # Only active public blood requests that should still be visible
@@ -115,7 +139,8 @@ def home(request):
         .order_by("-created_at")
     )
 
-    # Cards section: only active emergency requests
+    # one LIMIT 5 query; the cards section (same rows, same order) reuses its first 4
+    urgent_requests = list(urgent_requests[:5])
     recent_requests = urgent_requests[:4]
 
     # Keep your featured campaign logic
@@ -156,59 +181,38 @@ def home(request):
 
     # ---------- 2) Blood campaign popup fallback ----------
     if not home_popup:
-        BloodCampaign = None
-        try:
-            from hospitals.models import BloodCampaign as BloodCampaign
-        except Exception:
-            try:
-                from blood.models import BloodCampaign as BloodCampaign
-            except Exception:
-                BloodCampaign = None
-
-        if BloodCampaign:
-            def safe_first(filters: dict, order_by: str):
-                try:
-                    return BloodCampaign.objects.filter(**filters).order_by(order_by).first()
-                except Exception:
-                    return None
-
-            bc = (
-                safe_first({"status": "ONGOING"}, "-id")
-                or safe_first({"status": "ACTIVE"}, "-id")
-                or safe_first({"is_active": True}, "-id")
-            )
-
-            if bc:
-                title = getattr(bc, "title", None) or getattr(bc, "name", None) or "Blood Donation Camp"
-                city = getattr(bc, "city", None) or getattr(bc, "location_city", None) or ""
-                image_url = ""
-                try:
-                    if getattr(bc, "image", None):
-                        image_url = bc.image.url
-                except Exception:
-                    image_url = ""
-
-                home_popup = {
-                    "kind": "blood_campaign",
-                    "id": bc.id,
-                    "title": title,
-                    "subtitle": f"Blood donation camp is active{(' in ' + city) if city else ''}.",
-                    "image_url": image_url,
-                    "cta_text": "View Camps",
-                    "cta_url": reverse("blood_campaigns"),
-                    "pct": 0,
-                    "raised": "",
-                    "target": "",
-                    "deadline": "",
-                }
-
-    context = {
-        "urgent_requests": urgent_requests[:5],
+        # hospitals.BloodCampaign has a fixed schema: a camp that is running now
+        # is status=ONGOING (there is no ACTIVE status or is_active flag), so one query
+        bc = BloodCampaign.objects.filter(status="ONGOING").order_by("-id").first()
+
+        if bc:
+            city = bc.city or ""
+            image_url = bc.cover_image.url if bc.cover_image else ""
+
+            home_popup = {
+                "kind": "blood_campaign",
+                "id": bc.id,
+                "title": bc.title or "Blood Donation Camp",
+                "subtitle": f"Blood donation camp is active{(' in ' + city) if city else ''}.",
+                "image_url": image_url,
+                "cta_text": "View Camps",
+                "cta_url": cached_reverse("blood_campaigns"),
+                "pct": 0,
+                "raised": "",
+                "target": "",
+                "deadline": "",
+            }
+
+    # evaluated here so the cached context holds rows, not lazy querysets
+    return {
+        "urgent_requests": urgent_requests,
         "recent_requests": recent_requests,
         "featured_campaign": featured_campaign,
         "home_popup": home_popup,
     }
-    return render(request, "core/home.html", context)
+
+
+DIRECTORY_BLOOD_GROUPS = frozenset(bg for bg, _ in UserProfile.BLOOD_GROUPS)
 
 
 def public_donor_directory(request):
@@ -236,25 +240,21 @@ def public_donor_directory(request):
     qs = (
         CustomUser.objects
         .filter(is_active=True, is_donor=True)
-        .select_related("profile", "kyc")
         .filter(Q(is_verified=True) | Q(kyc__status="APPROVED"))
-        .annotate(
-            last_verified_donation_at=Max(
-                "blood_donations__donated_at",
-                filter=Q(blood_donations__status="VERIFIED"),
-            )
-        )
         # eligible only: never donated OR last verified donation <= cutoff
-        .filter(Q(last_verified_donation_at__isnull=True) | Q(last_verified_donation_at__lte=cutoff))
+        # (profile column kept current by blood.signals, served by its db_index)
+        .filter(
+            Q(profile__last_verified_donation_at__isnull=True)
+            | Q(profile__last_verified_donation_at__lte=cutoff)
+        )
         # require donor has blood group and city set for directory usefulness
         .exclude(profile__blood_group="")
         .exclude(profile__city="")
     )
 
     # --- Blood group filter ---
-    allowed_groups = {bg for bg, _ in UserProfile.BLOOD_GROUPS}
     if blood_group:
-        if blood_group in allowed_groups:
+        if blood_group in DIRECTORY_BLOOD_GROUPS:
             qs = qs.filter(profile__blood_group=blood_group)
         else:
             messages.error(request, "Invalid blood group filter.")
@@ -264,11 +264,9 @@ def public_donor_directory(request):
     if city:
         aliases = city_aliases(city)
         canon_set = {canonical_city(a) for a in aliases if a}
-
-        city_q = Q(profile__city_canon__in=list(canon_set))
-        for a in aliases:
-            city_q |= Q(profile__city__iexact=a)
-        qs = qs.filter(city_q)
+        # city_canon is kept by UserProfile.save() (and backfilled), so one
+        # indexed IN covers every alias spelling; no per-alias iexact OR chain
+        qs = qs.filter(profile__city_canon__in=list(canon_set))
 
     # --- Search filter ---
     if q:
@@ -281,6 +279,13 @@ def public_donor_directory(request):
     # --- Ordering: highest points first (gamification), then newest users ---
     qs = qs.order_by("-profile__points", "-date_joined")
 
+    # --- Rows as dicts: the cards only show name + profile blood group/city/points
+    # (no model methods), so skip CustomUser/UserProfile instantiation ---
+    qs = qs.values(
+        "id", "username", "first_name", "last_name",
+        "profile__blood_group", "profile__city", "profile__points",
+    )
+
     # --- Pagination ---
     paginator = Paginator(qs, 24)  # 24 donors per page
     page_obj = paginator.get_page(page)
@@ -376,13 +381,11 @@ def register(request):
                         phone_number=phone,
                     )
 
-                    # profile + set city (IMPORTANT: save without limiting update_fields)
-                    profile, _ = UserProfile.objects.get_or_create(user=user)
+                    # profile + KYC rows come from the post_save signal; user.profile
+                    # is already cached by it. Set city (save() also updates city_canon)
+                    profile = user.profile
                     profile.city = city
-                    profile.save() 
-
-                    # Ensure KYC exists (safe)
-                    KYCProfile.objects.get_or_create(user=user)
+                    profile.save(update_fields=["city"])
 
                 # Send email verification (don’t block registration if email fails)
                 try:
@@ -394,6 +397,20 @@ def register(request):
                 messages.success(request, "Account created successfully! Please login.")
                 return redirect("login")
 
+            except IntegrityError:
+                # lost a race with a concurrent registration for the same username/email:
+                # report it as the form's own uniqueness check would
+                username_taken = (
+                    CustomUser.objects.alias(username_lower=Lower("username"))
+                    .filter(username_lower=username.lower()).exists()
+                )
+                if username_taken:
+                    field, error = "username", "Username is already taken"
+                else:
+                    field, error = "email", "Email is already registered"
+                form.add_error(field, error)
+                messages.error(request, f"{field}: {error}")
+
             except Exception as e:
                 messages.error(request, f"System Error: {e}")
 
@@ -416,7 +433,6 @@ def login_view(request):
     identifier_value = ""
     show_resend_verification = False
     resend_email = ""
-    require_verified_email = getattr(settings, "EMAIL_VERIFICATION_REQUIRED", True)
 
     if request.method == "POST":
         identifier = (request.POST.get("username") or "").strip()
@@ -428,14 +444,17 @@ def login_view(request):
         # Allow login via email too
         if user is None and identifier:
             try:
-                u = CustomUser.objects.get(email__iexact=identifier)
+                # LOWER(email) = lower(identifier) uses accounts_user_email_lower_idx;
+                # email__iexact compiles to UPPER(...) and cannot
+                u = CustomUser.objects.alias(email_lower=Lower("email")).get(email_lower=identifier.lower())
                 user = authenticate(request, username=u.username, password=password)
             except CustomUser.DoesNotExist:
                 user = None
 
         if user is not None:
-            # Block login if verification required
-            if require_verified_email and not user.email_verified:
+            # Block login if verification required (default declared in settings.py;
+            # read here rather than hoisted to import so override_settings still applies)
+            if settings.EMAIL_VERIFICATION_REQUIRED and not user.email_verified:
                 show_resend_verification = True
                 resend_email = user.email or ""
 
@@ -514,7 +533,8 @@ def verify_email(request, token: str):
     except User.DoesNotExist:
         return HttpResponseBadRequest("Invalid verification link.")
 
-    if not user.email or user.email.strip().lower() != email:
+    # constant-time: the decoded email must not be matched with a short-circuiting ==
+    if not user.email or not constant_time_compare(user.email.strip().lower(), email):
         return HttpResponseBadRequest("Invalid verification link.")
 
     user.email_verified = True
@@ -534,15 +554,19 @@ def resend_verification_email_public(request):
         identifier = (request.POST.get("email") or request.POST.get("identifier") or "").strip()
 
         if identifier:
+            ident = identifier.lower()
+            # LOWER() lookups hit the functional index / CI unique constraint
             user = (
-                CustomUser.objects.filter(email__iexact=identifier).first()
-                or CustomUser.objects.filter(username__iexact=identifier).first()
+                CustomUser.objects.alias(email_lower=Lower("email")).filter(email_lower=ident).first()
+                or CustomUser.objects.alias(username_lower=Lower("username")).filter(username_lower=ident).first()
             )
             if user and (not user.email_verified) and user.email:
                 try:
                     send_verification_email_to_user(request, user)
                 except Exception:
                     pass
+            else:
+                make_dummy_email_token(identifier)
 
         messages.success(request, "If an account exists, a verification link has been sent.")
         return redirect(next_url)
@@ -550,49 +574,94 @@ def resend_verification_email_public(request):
     return render(request, "accounts/resend_verification_public.html", {"next": next_url})
 
 
+# (threshold, name, badge css), ascending by threshold
+POINT_LEVELS = (
+    (0, "New", "badge-secondary"),
+    (100, "Bronze", "badge-warning"),
+    (300, "Silver", "badge-info"),
+    (700, "Gold", "badge-warning"),
+    (1500, "Platinum", "badge-primary"),
+)
+_POINT_THRESHOLDS = tuple(t for t, _, _ in POINT_LEVELS)
+
+
 def _points_level(points: int):
-    levels = [
-        (0, "New", "badge-secondary"),
-        (100, "Bronze", "badge-warning"),
-        (300, "Silver", "badge-info"),
-        (700, "Gold", "badge-warning"),
-        (1500, "Platinum", "badge-primary"),
-    ]
-    current = levels[0]
-    next_level = None
-
-    for i, (threshold, name, css) in enumerate(levels):
-        if points >= threshold:
-            current = (threshold, name, css)
-            next_level = levels[i + 1] if i + 1 < len(levels) else None
-
-    return current, next_level
-
-
-def _profile_completion(profile):
-    checks = {
-        "blood_group": bool(profile.blood_group),
-        "city": bool(profile.city),
-        "date_of_birth": bool(profile.date_of_birth),
-        "emergency_contact_name": bool(profile.emergency_contact_name),
-        "emergency_contact_phone": bool(profile.emergency_contact_phone),
-        "address_line": bool(profile.address_line),
-        "country": bool(profile.country),
+    i = bisect_right(_POINT_THRESHOLDS, points) - 1
+    if i < 0:
+        # below every threshold (negative points): lowest level, nothing next
+        return POINT_LEVELS[0], None
+    next_level = POINT_LEVELS[i + 1] if i + 1 < len(POINT_LEVELS) else None
+    return POINT_LEVELS[i], next_level
+
+
+# (user flag, label) in display order; shared by the profile page and certificate
+ROLE_LABELS = (
+    ("is_donor", "Donor"),
+    ("is_recipient", "Recipient"),
+    ("is_hospital_admin", "Hospital Admin"),
+)
+
+
+def _role_labels(user):
+    return [label for attr, label in ROLE_LABELS if getattr(user, attr)] or ["User"]
+
+
+PROFILE_STATS_TTL = 60 * 5  # seconds
+
+
+def _profile_stats(user):
+    # Crowdfunding stats: total, count and distinct campaigns in one query
+    don = (
+        Donation.objects
+        .filter(donor_user=user, status="SUCCESS")
+        .aggregate(
+            total=Sum("amount"),
+            count=Count("id"),
+            campaigns=Count("campaign_id", distinct=True),
+        )
+    )
+    don_total = don["total"] or 0
+    don_count = don["count"]
+    don_campaigns = don["campaigns"]
+
+    # Social Impact stats: verified blood count and units in one query
+    blood = (
+        BloodDonation.objects
+        .filter(donor_user=user, status="VERIFIED")
+        .aggregate(count=Count("id"), units=Sum("units"))
+    )
+    blood_verified_count = blood["count"]
+    blood_verified_units = blood["units"] or 0
+
+    organ_verified_count = OrganPledge.objects.filter(donor=user, status="VERIFIED").count()
+
+    return {
+        "don_total": don_total,
+        "don_count": don_count,
+        "don_campaigns": don_campaigns,
+        "blood_verified_count": blood_verified_count,
+        "blood_verified_units": blood_verified_units,
+        "organ_verified_count": organ_verified_count,
     }
-    total = len(checks)
-    done = sum(1 for v in checks.values() if v)
-    percent = int((done / total) * 100) if total else 0
-    missing = [k for k, v in checks.items() if not v]
-    return percent, missing
 
 
 @login_required
 def profile_view(request):
-    profile = request.user.profile
-    kyc = getattr(request.user, "kyc", None)
+    # profile + KYC joined onto one user row, family members in one prefetch
+    # (instead of a query each through the lazily loaded request.user)
+    user = (
+        CustomUser.objects
+        .select_related("profile", "kyc")
+        .prefetch_related(Prefetch("family_members", queryset=FamilyMember.objects.order_by("-id")))
+        .get(pk=request.user.pk)
+    )
+    profile = user.profile
+    kyc = getattr(user, "kyc", None)
 
-    family_members = request.user.family_members.order_by("-id")
-    emergency_family_count = family_members.filter(is_emergency_profile=True).count()
+    # a user has a handful of family members: count emergency profiles in Python
+    # from the prefetched list instead of a second COUNT query
+    family_members = list(user.family_members.all())
+    emergency_family_count = sum(1 for fm in family_members if fm.is_emergency_profile)
 
     points = int(getattr(profile, "points", 0) or 0)
     (cur_threshold, cur_level, cur_css), next_level = _points_level(points)
@@ -608,23 +677,17 @@ def profile_view(request):
         level_progress = 100
         points_to_next = 0
 
-    completion_percent, missing_fields = _profile_completion(profile)
+    # stored by UserProfile.save(); the missing list is only needed below 100%
+    completion_percent = profile.completion_percent
+    missing_fields = profile.missing_completion_fields() if completion_percent < 100 else []
 
-    roles = []
-    if request.user.is_donor:
-        roles.append("Donor")
-    if request.user.is_recipient:
-        roles.append("Recipient")
-    if request.user.is_hospital_admin:
-        roles.append("Hospital Admin")
-    if not roles:
-        roles = ["User"]
+    roles = _role_labels(user)
 
     donor_eligibility = None
-    if request.user.is_donor:
-        last = last_verified_donation(request.user)
-        nxt = next_eligible_datetime(request.user)
-        eligible = is_eligible(request.user)
+    if user.is_donor:
+        last = last_verified_donation(user)
+        nxt = next_eligible_datetime(user)
+        eligible = is_eligible(user)
 
         days_remaining = 0
         progress_percent = 100
@@ -643,35 +706,26 @@ def profile_view(request):
             "eligibility_days": ELIGIBILITY_DAYS,
         }
 
-    # Crowdfunding stats 
-    don_total = (
-        Donation.objects
-        .filter(donor_user=request.user, status="SUCCESS")
-        .aggregate(s=Sum("amount"))["s"] or 0
-    )
-    don_count = Donation.objects.filter(donor_user=request.user, status="SUCCESS").count()
-    don_campaigns = (
-        Donation.objects
-        .filter(donor_user=request.user, status="SUCCESS")
-        .values("campaign_id").distinct().count()
+    # Crowdfunding / impact aggregates: cached per user, dropped by accounts.signals
+    # whenever one of the user's donations or pledges is saved/deleted
+    stats = cache.get_or_set(
+        profile_stats_cache_key(user.pk),
+        lambda: _profile_stats(user),
+        PROFILE_STATS_TTL,
     )
+    don_total = stats["don_total"]
+    blood_verified_count = stats["blood_verified_count"]
+    organ_verified_count = stats["organ_verified_count"]
 
     crowdfunding_stats = {
         "total_amount": don_total,
-        "count": don_count,
-        "campaigns_supported": don_campaigns,
+        "count": stats["don_count"],
+        "campaigns_supported": stats["don_campaigns"],
     }
 
-    # Social Impact stats
-    blood_verified_qs = BloodDonation.objects.filter(donor_user=request.user, status="VERIFIED")
-    blood_verified_count = blood_verified_qs.count()
-    blood_verified_units = blood_verified_qs.aggregate(s=Sum("units"))["s"] or 0
-
-    organ_verified_count = OrganPledge.objects.filter(donor=request.user, status="VERIFIED").count()
-
     impact_stats = {
         "blood_verified_count": blood_verified_count,
-        "blood_verified_units": blood_verified_units,
+        "blood_verified_units": stats["blood_verified_units"],
         "organ_verified_count": organ_verified_count,
         "crowdfunding_total": don_total,
         "points": points,
@@ -680,7 +734,7 @@ def profile_view(request):
 
     # Certificate rule (we can change this later to our pref but for now we are going with this simple logic to allow certificate download if user is KYC verified or has at least 1 verified blood donation):
     # Allow certificate if KYC verified OR has at least 1 verified blood donation
-    can_download_certificate = bool(request.user.is_verified or blood_verified_count > 0 or organ_verified_count > 0)
+    can_download_certificate = bool(user.is_verified or blood_verified_count > 0 or organ_verified_count > 0)
 
     return render(request, "accounts/profile.html", {
         "profile": profile,
@@ -713,9 +767,12 @@ def profile_edit(request):
         profile_form = UserProfileForm(request.POST, instance=profile)
 
         if basics_form.is_valid() and role_form.is_valid() and profile_form.is_valid():
-            basics_form.save()
-            role_form.save()
-            profile_form.save()
+            # both user forms edit the same request.user instance (is_valid()
+            # already applied their fields): one UPDATE limited to those columns
+            # instead of two full-row saves
+            with transaction.atomic():
+                request.user.save(update_fields=[*basics_form._meta.fields, *role_form._meta.fields])
+                profile_form.instance.save(update_fields=profile_form._meta.fields)
             messages.success(request, "Profile updated successfully.")
             return redirect("profile")
 
@@ -858,52 +915,73 @@ def kyc_submit(request):
                 f"Please upload a clear JPG, JPEG, PNG, or WEBP file."
             )
 
-    def save_doc(doc_type, f, *, label, allow_pdf=False):
-        if not f:
+    def save_docs(uploads):
+        """
+        uploads: (doc_type, file, label, allow_pdf) tuples; empty files are skipped.
+        One SELECT for the files being replaced, then a single INSERT ... ON CONFLICT
+        (kyc, doc_type) DO UPDATE SET file (instead of update_or_create per file).
+        """
+        cleaned = {
+            doc_type: normalize_image_upload(f, label=label, allow_pdf=allow_pdf)
+            for doc_type, f, label, allow_pdf in uploads
+            if f
+        }
+        if not cleaned:
             return
 
-        cleaned_file = normalize_image_upload(f, label=label, allow_pdf=allow_pdf)
+        replaced_names = list(
+            kyc.documents.filter(doc_type__in=cleaned).values_list("file", flat=True)
+        )
 
-        KYCDocument.objects.update_or_create(
-            kyc=kyc,
-            doc_type=doc_type,
-            defaults={"file": cleaned_file},
+        # bulk_create runs FileField.pre_save, so every new file is stored as usual;
+        # conflicting rows keep their id/uploaded_at and only get the new file
+        KYCDocument.objects.bulk_create(
+            [KYCDocument(kyc=kyc, doc_type=doc_type, file=f) for doc_type, f in cleaned.items()],
+            update_conflicts=True,
+            unique_fields=["kyc", "doc_type"],
+            update_fields=["file"],
         )
 
+        # the upsert bypasses the pre_save cleanup signal: remove replaced files,
+        # but only once the submission commits (a rollback leaves rows pointing at them)
+        storage = KYCDocument._meta.get_field("file").storage
+
+        def delete_replaced():
+            for name in replaced_names:
+                if name:
+                    storage.delete(name)
+
+        transaction.on_commit(delete_replaced)
+
     if request.method == "POST":
+        # a body larger than every upload at the size cap can't be valid: one clear message
+        # instead of per-field errors (CsrfViewMiddleware has already parsed the body)
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+        if content_length > KYC_MAX_REQUEST_BYTES:
+            messages.error(request, f"Upload too large. Each file must be {KYC_MAX_UPLOAD_MB}MB or smaller.")
+            return redirect("kyc_submit")
+
         profile_form = KYCProfileForm(request.POST, instance=kyc)
         upload_form = KYCUploadForm(request.POST, request.FILES)
 
         if profile_form.is_valid() and upload_form.is_valid():
             try:
-                profile_form.save()
+                # profile, documents and status commit together (or not at all)
+                with transaction.atomic():
+                    profile_form.save()
 
-                save_doc(
-                    "ID_FRONT",
-                    upload_form.cleaned_data["id_front"],
-                    label="ID Front",
-                    allow_pdf=False,
-                )
-                save_doc(
-                    "ID_BACK",
-                    upload_form.cleaned_data.get("id_back"),
-                    label="ID Back",
-                    allow_pdf=False,
-                )
-                save_doc(
-                    "SELFIE",
-                    upload_form.cleaned_data["selfie"],
-                    label="Selfie",
-                    allow_pdf=False,
-                )
-                save_doc(
-                    "ADDRESS_PROOF",
-                    upload_form.cleaned_data.get("address_proof"),
-                    label="Proof of Address",
-                    allow_pdf=True,
-                )
+                    cd = upload_form.cleaned_data
+                    save_docs([
+                        ("ID_FRONT", cd["id_front"], "ID Front", False),
+                        ("ID_BACK", cd.get("id_back"), "ID Back", False),
+                        ("SELFIE", cd["selfie"], "Selfie", False),
+                        ("ADDRESS_PROOF", cd.get("address_proof"), "Proof of Address", True),
+                    ])
 
-                kyc.mark_submitted()
+                    kyc.mark_submitted()
                 messages.success(request, "KYC submitted successfully. Pending admin review.")
                 return redirect("profile")
 
@@ -933,6 +1011,50 @@ def kyc_submit(request):
     })
 
 
+# Certificate theme colors (parsed once, not per PDF)
+CERT_NAVY = HexColor("#0a2558")
+CERT_RED = HexColor("#e63946")
+CERT_WHITE = HexColor("#ffffff")
+CERT_DARK = HexColor("#333333")
+CERT_BORDER = HexColor("#e6eaf2")
+CERT_LIGHT_BG = HexColor("#f8f9fa")
+CERT_SUBTITLE = HexColor("#dbe5ff")
+
+
+@lru_cache(maxsize=1)
+def _logo_reader_for(name):
+    """
+    Decoded ImageReader for one stored logo file. Keyed by file name (a new upload
+    gets a new name), so the logo is fetched and decoded once per process, not per PDF.
+    """
+    def read_logo():
+        f = SiteSetting._meta.get_field("site_logo").storage.open(name, "rb")
+        try:
+            return f.read()
+        finally:
+            f.close()
+
+    # raw bytes also shared through the cache, so remote storage (Cloudinary)
+    # is hit once per logo rather than once per worker
+    data = cache.get_or_set(f"site_logo_bytes:{name}", read_logo, 60 * 60)
+    if not data:
+        return None
+    return ImageReader(io.BytesIO(data))
+
+
+def _site_logo_reader():
+    """
+    Load SiteSetting.site_logo safely (works with local disk and remote storage).
+    """
+    try:
+        name = SiteSetting.objects.filter(pk=1).values_list("site_logo", flat=True).first()
+        if not name:
+            return None
+        return _logo_reader_for(name)
+    except Exception:
+        return None
+
+
 @login_required
 def download_certificate_pdf(request):
     """
@@ -966,38 +1088,17 @@ def download_certificate_pdf(request):
         full = title_case_name((u.get_full_name() or "").strip())
         if full:
             return f"Share4Life Admin ({full})"
-        username = getattr(u, "username", "") or ""
-        return f"Share4Life Admin ({username})" if username else "Share4Life Admin"
+        return f"Share4Life Admin ({u.username})" if u.username else "Share4Life Admin"
 
     def display_person(u):
         if not u:
             return "—"
-        if getattr(u, "is_superuser", False) or getattr(u, "is_staff", False):
+        if u.is_superuser or u.is_staff:
             return display_admin(u)
         full = title_case_name((u.get_full_name() or "").strip())
         if full:
             return full
-        return getattr(u, "username", "—") or "—"
-
-    def get_logo_reader():
-        """
-        Load SiteSetting.site_logo safely (works with local disk and remote storage).
-        """
-        try:
-            ss = SiteSetting.objects.filter(pk=1).first()
-            if not ss or not ss.site_logo:
-                return None
-
-            ss.site_logo.open("rb")
-            data = ss.site_logo.read()
-            ss.site_logo.close()
-
-            if not data:
-                return None
-
-            return ImageReader(io.BytesIO(data))
-        except Exception:
-            return None
+        return u.username or "—"
 
     def draw_contain_image_in_box(c, img_reader, box_x, box_y, box_w, box_h, inner_pad=6):
         """
@@ -1037,17 +1138,17 @@ def download_certificate_pdf(request):
         box_x = margin
         box_y = top_y - box_h
 
-        c.setStrokeColor(light_border)
-        c.setFillColor(fill_color if fill_color is not None else white)
+        c.setStrokeColor(CERT_BORDER)
+        c.setFillColor(fill_color if fill_color is not None else CERT_WHITE)
         c.rect(box_x, box_y, box_w, box_h, stroke=1, fill=1)
 
         title_y = top_y - top_pad
-        c.setFillColor(navy)
+        c.setFillColor(CERT_NAVY)
         c.setFont("Helvetica-Bold", 14)
         c.drawString(box_x + left_pad, title_y, title)
 
         yy = title_y - title_gap
-        c.setFillColor(dark)
+        c.setFillColor(CERT_DARK)
         c.setFont("Helvetica", 12)
         for line in lines:
             c.drawString(box_x + left_pad, yy, line)
@@ -1056,11 +1157,15 @@ def download_certificate_pdf(request):
         return box_y
 
     # ---------------- Eligibility checking ----------------
-    blood_verified_qs = BloodDonation.objects.filter(donor_user=request.user, status="VERIFIED")
-    blood_verified_count = blood_verified_qs.count()
-
-    organ_verified_qs = OrganPledge.objects.filter(donor=request.user, status="VERIFIED")
-    organ_verified_count = organ_verified_qs.count()
+    # same per-user aggregates as profile_view (which decides whether the download
+    # button shows): shared cache entry, dropped by accounts.signals on changes
+    stats = cache.get_or_set(
+        profile_stats_cache_key(request.user.pk),
+        lambda: _profile_stats(request.user),
+        PROFILE_STATS_TTL,
+    )
+    blood_verified_count = stats["blood_verified_count"]
+    organ_verified_count = stats["organ_verified_count"]
 
     if not (request.user.is_verified or blood_verified_count > 0 or organ_verified_count > 0):
         messages.error(
@@ -1069,75 +1174,84 @@ def download_certificate_pdf(request):
         )
         return redirect("profile")
 
-    # ---------------- Stats ----------------
-    blood_verified_units = blood_verified_qs.aggregate(s=Sum("units"))["s"] or 0
-    cf_total = (
-        Donation.objects
-        .filter(donor_user=request.user, status="SUCCESS")
-        .aggregate(s=Sum("amount"))["s"] or 0
+    # gate passed: profile, KYC and its reviewer joined onto one user row
+    # (instead of a lazy query each for request.user.profile/.kyc/.kyc.reviewed_by)
+    user = (
+        CustomUser.objects
+        .select_related("profile", "kyc", "kyc__reviewed_by")
+        .get(pk=request.user.pk)
     )
 
-    try:
-        profile_points = int(
-            UserProfile.objects.filter(user=request.user).values_list("points", flat=True).first() or 0
-        )
-    except Exception:
-        profile_points = int(getattr(getattr(request.user, "profile", None), "points", 0) or 0)
-
-    # ---------------- Verification details ----------------
-    kyc = getattr(request.user, "kyc", None)
-    kyc_is_approved = bool(kyc and getattr(kyc, "status", "") == "APPROVED")
-    kyc_verified_for_pdf = bool(request.user.is_verified or kyc_is_approved)
+    # ---------------- Stats ----------------
+    blood_verified_units = stats["blood_verified_units"]
+    cf_total = stats["don_total"]
 
-    kyc_reviewer = display_person(getattr(kyc, "reviewed_by", None)) if kyc_is_approved else "—"
-    kyc_reviewed_at = fmt_dt(getattr(kyc, "reviewed_at", None)) if kyc_is_approved else "—"
+    # profile came with the user (select_related above): no separate points query
+    profile = getattr(user, "profile", None)
+    profile_points = profile.points if profile else 0
 
-    last_blood = blood_verified_qs.order_by("-verified_at").select_related("verified_by", "verified_by_org").first()
-    blood_verified_by = display_person(getattr(last_blood, "verified_by", None)) if last_blood else "—"
-    blood_verified_org = (getattr(getattr(last_blood, "verified_by_org", None), "name", "") or "—") if last_blood else "—"
-    blood_verified_at = fmt_dt(getattr(last_blood, "verified_at", None)) if last_blood else "—"
+    # ---------------- Verification details ----------------
+    kyc = getattr(user, "kyc", None)
+    kyc_is_approved = bool(kyc and kyc.status == "APPROVED")
+    kyc_verified_for_pdf = bool(user.is_verified or kyc_is_approved)
+
+    kyc_reviewer = display_person(kyc.reviewed_by) if kyc_is_approved else "—"
+    kyc_reviewed_at = fmt_dt(kyc.reviewed_at) if kyc_is_approved else "—"
+
+    # the verification lines only need the verifier's display name, the org name
+    # and the timestamp: project those instead of full donation/user/org rows
+    verification_only = (
+        "verified_at",
+        "verified_by__first_name", "verified_by__last_name", "verified_by__username",
+        "verified_by__is_staff", "verified_by__is_superuser",
+        "verified_by_org__name",
+    )
 
-    last_pledge = organ_verified_qs.order_by("-verified_at").select_related("verified_by", "verified_by_org").first()
-    organ_verified_by = display_person(getattr(last_pledge, "verified_by", None)) if last_pledge else "—"
-    organ_verified_org = (getattr(getattr(last_pledge, "verified_by_org", None), "name", "") or "—") if last_pledge else "—"
-    organ_verified_at = fmt_dt(getattr(last_pledge, "verified_at", None)) if last_pledge else "—"
+    blood_verified_qs = BloodDonation.objects.filter(donor_user=user, status="VERIFIED")
+    last_blood = (
+        blood_verified_qs.order_by("-verified_at")
+        .select_related("verified_by", "verified_by_org")
+        .only(*verification_only)
+        .first()
+    )
+    blood_verified_by = blood_verified_org = blood_verified_at = "—"
+    if last_blood:
+        blood_verified_by = display_person(last_blood.verified_by)
+        blood_verified_org = (last_blood.verified_by_org.name if last_blood.verified_by_org else "") or "—"
+        blood_verified_at = fmt_dt(last_blood.verified_at)
+
+    organ_verified_qs = OrganPledge.objects.filter(donor=user, status="VERIFIED")
+    last_pledge = (
+        organ_verified_qs.order_by("-verified_at")
+        .select_related("verified_by", "verified_by_org")
+        .only(*verification_only)
+        .first()
+    )
+    organ_verified_by = organ_verified_org = organ_verified_at = "—"
+    if last_pledge:
+        organ_verified_by = display_person(last_pledge.verified_by)
+        organ_verified_org = (last_pledge.verified_by_org.name if last_pledge.verified_by_org else "") or "—"
+        organ_verified_at = fmt_dt(last_pledge.verified_at)
 
     # ---------------- Certificate meta ----------------
-    base_name = (request.user.get_full_name() or request.user.username).strip()
-    full_name = title_case_name(base_name) or request.user.username
+    base_name = (user.get_full_name() or user.username).strip()
+    full_name = title_case_name(base_name) or user.username
     issued_date = timezone.localdate().strftime("%Y-%m-%d")
-    cert_id = f"S4L-{request.user.id:06d}-{timezone.localdate().strftime('%Y%m%d')}"
-
-    roles = []
-    if request.user.is_donor:
-        roles.append("Donor")
-    if request.user.is_recipient:
-        roles.append("Recipient")
-    if request.user.is_hospital_admin:
-        roles.append("Hospital Admin")
-    if not roles:
-        roles = ["User"]
+    cert_id = f"S4L-{user.id:06d}-{timezone.localdate().strftime('%Y%m%d')}"
+
+    roles = _role_labels(user)
 
     # ---------------- PDF response ----------------
-    filename = f"Share4Life_Certificate_{request.user.username}.pdf"
-    response = HttpResponse(content_type="application/pdf")
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    filename = f"Share4Life_Certificate_{user.username}.pdf"
+    buf = io.BytesIO()
 
-    c = canvas.Canvas(response, pagesize=A4)
+    c = canvas.Canvas(buf, pagesize=A4)
     w, h = A4
 
-    # Theme colors
-    navy = HexColor("#0a2558")
-    red = HexColor("#e63946")
-    white = HexColor("#ffffff")
-    dark = HexColor("#333333")
-    light_border = HexColor("#e6eaf2")
-    light_bg = HexColor("#f8f9fa")
-
     margin = 36
 
     # Outer frame
-    c.setStrokeColor(light_border)
+    c.setStrokeColor(CERT_BORDER)
     c.setLineWidth(1)
     c.rect(margin - 12, margin - 12, w - 2 * (margin - 12), h - 2 * (margin - 12), stroke=1, fill=0)
 
@@ -1147,59 +1261,46 @@ def download_certificate_pdf(request):
 
     band_left = margin - 12
     band_width = w - 2 * (margin - 12)
-    band_right = band_left + band_width
 
-    c.setFillColor(navy)
+    c.setFillColor(CERT_NAVY)
     c.rect(band_left, header_y, band_width, header_h, stroke=0, fill=1)
 
-    # inner padding INSIDE blue header (left/right/top/bottom)
+    # inner padding INSIDE blue header (left/top/bottom)
     inner_pad_x = 22
     inner_pad_y = 12
     inner_left = band_left + inner_pad_x
-    inner_right = band_right - inner_pad_x
 
     # Logo box 
-    logo_reader = get_logo_reader()
+    logo_reader = _site_logo_reader()
     box_w = 190
     box_h = header_h - 2 * inner_pad_y
     box_x = inner_left
     box_y = header_y + inner_pad_y
 
     if logo_reader:
-        c.setFillColor(white)
+        c.setFillColor(CERT_WHITE)
         c.rect(box_x, box_y, box_w, box_h, stroke=0, fill=1)
         draw_contain_image_in_box(c, logo_reader, box_x, box_y, box_w, box_h, inner_pad=6)
 
-    # Title with right padding + auto shrink so it never touches the right edge
+    # Title: fixed 26pt; the text is constant and fits the space right of the
+    # logo box (about 267pt of the 287pt before the header's right padding)
     title_text = "Share4Life Certificate"
     title_x = box_x + box_w + 26
-    title_y = header_y + (header_h / 2) + 8
-    max_title_w = max(inner_right - title_x, 60)
-
-    font_size = 22
-    while font_size >= 14:
-        c.setFont("Helvetica-Bold", font_size)
-        if c.stringWidth(title_text, "Helvetica-Bold", font_size) <= max_title_w:
-            break
-        font_size -= 1
+    title_font = 26
 
     title_y = header_y + (header_h * 0.58)
     subtitle_y = header_y + (header_h * 0.35)
-    title_font = 26
-    c.setFillColor(white)
+    c.setFillColor(CERT_WHITE)
     c.setFont("Helvetica-Bold", title_font)
     c.drawString(title_x, title_y, title_text)
 
-    c.setFillColor(white)
-    c.drawString(title_x, title_y, title_text)
-
     c.setFont("Helvetica", 12)
-    c.setFillColor(HexColor("#dbe5ff"))
+    c.setFillColor(CERT_SUBTITLE)
     c.drawString(title_x, subtitle_y, "Certificate of Appreciation")
 
     # ---------------- Meta row ----------------
     y = header_y - 28
-    c.setFillColor(navy)
+    c.setFillColor(CERT_NAVY)
     c.setFont("Helvetica", 11)
     c.drawString(margin, y, f"Certificate ID: {cert_id}")
     c.drawRightString(w - margin, y, f"Issued on: {issued_date}")
@@ -1210,12 +1311,12 @@ def download_certificate_pdf(request):
     c.drawString(margin, y, "Awarded to:")
     y -= 30
     c.setFont("Helvetica-Bold", 24)
-    c.setFillColor(red)
+    c.setFillColor(CERT_RED)
     c.drawString(margin, y, full_name)
 
     # Roles + KYC
     y -= 34
-    c.setFillColor(navy)
+    c.setFillColor(CERT_NAVY)
     c.setFont("Helvetica", 12)
     c.drawString(margin, y, f"Role(s): {', '.join(roles)}")
     y -= 18
@@ -1232,7 +1333,7 @@ def download_certificate_pdf(request):
     ]
     bottom_y = draw_section_box(
         c, "Social Impact Summary", impact_lines, y,
-        box_h=145, fill_color=light_bg
+        box_h=145, fill_color=CERT_LIGHT_BG
     )
 
     # ---------------- Verification Details ----------------
@@ -1244,15 +1345,19 @@ def download_certificate_pdf(request):
     ]
     draw_section_box(
         c, "Verification Details", ver_lines, y,
-        box_h=145, fill_color=white
+        box_h=145, fill_color=CERT_WHITE
     )
 
     # Footer note
     c.setFont("Helvetica-Oblique", 9)
-    c.setFillColor(dark)
+    c.setFillColor(CERT_DARK)
     c.drawString(margin, 62, "This certificate is generated digitally by Share4Life based on verified platform records.")
     c.drawString(margin, 48, "For confirmation, match Certificate ID and verification details with admin records.")
 
     c.showPage()
     c.save()
-    return response
\ No newline at end of file
+
+    # FileResponse streams the finished buffer in blocks (wsgi.file_wrapper when
+    # available), sets Content-Length and encodes the attachment filename safely
+    buf.seek(0)
+    return FileResponse(buf, as_attachment=True, filename=filename, content_type="application/pdf")
\ No newline at end of file
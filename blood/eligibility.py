@@ -1,9 +1,29 @@
 from datetime import timedelta
+from django.apps import apps
+from django.db.models import Max
 from django.utils import timezone
 from .models import BloodDonation
 
 ELIGIBILITY_DAYS = 90
 
+
+def refresh_eligibility_cache(user_id):
+    """
+    Recompute UserProfile.last_verified_donation_at / next_eligible_at for one donor
+    from their VERIFIED donations (so a later verify, reject or delete of an older
+    donation can never leave a stale or regressed value).
+    """
+    last = (
+        BloodDonation.objects
+        .filter(donor_user_id=user_id, status="VERIFIED")
+        .aggregate(m=Max("donated_at"))["m"]
+    )
+    Profile = apps.get_model("accounts", "UserProfile")
+    Profile.objects.filter(user_id=user_id).update(
+        last_verified_donation_at=last,
+        next_eligible_at=(last + timedelta(days=ELIGIBILITY_DAYS)) if last else None,
+    )
+
 def last_verified_donation(user):
     return (
         BloodDonation.objects
@@ -1,4 +1,5 @@
 import math
+from functools import lru_cache
 from django.db.models import Q
 from accounts.models import CustomUser
 from blood.eligibility import is_eligible
@@ -64,6 +65,7 @@ def nearby_city_canons(canon: str):
     return []
 
 
+@lru_cache(maxsize=1024)
 def canonical_city(value: str) -> str:
     """
     Normalize city input. Supports:
@@ -110,9 +112,12 @@ def canonical_city(value: str) -> str:
     return CITY_CANON.get(raw, raw)
 
 
+@lru_cache(maxsize=1024)
 def city_aliases(value: str):
+    # memoized (like canonical_city); frozenset so the shared cached value
+    # (and the CANON_ALIASES entry it comes from) can't be mutated by a caller
     canon = canonical_city(value)
-    return CANON_ALIASES.get(canon, {canon})
+    return frozenset(CANON_ALIASES.get(canon, (canon,)))
 
 
 def haversine_km(lat1, lon1, lat2, lon2):
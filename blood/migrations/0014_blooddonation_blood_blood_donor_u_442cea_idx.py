@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-16 19:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blood', '0013_bloodemailescalationstate_bloodrequestemaileduser_and_more'),
+        ('hospitals', '0005_bloodcampaign_actual_donors_count_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blooddonation',
+            index=models.Index(fields=['donor_user', 'status'], name='blood_blood_donor_u_442cea_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-16 20:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blood', '0014_blooddonation_blood_blood_donor_u_442cea_idx'),
+        ('hospitals', '0005_bloodcampaign_actual_donors_count_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publicbloodrequest',
+            index=models.Index(fields=['is_active', 'is_emergency', '-created_at'], name='blood_req_active_emerg_idx'),
+        ),
+    ]
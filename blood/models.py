@@ -98,6 +98,12 @@ class PublicBloodRequest(models.Model):
         help_text="Which organization should verify/handle this request.",
     )
 
+    class Meta:
+        indexes = [
+            # home ticker/cards: active emergency requests, newest first
+            models.Index(fields=["is_active", "is_emergency", "-created_at"], name="blood_req_active_emerg_idx"),
+        ]
+
     def __str__(self):
         return f"Need {self.blood_group} at {self.location_city}"
 
@@ -257,6 +263,9 @@ class BloodDonation(models.Model):
                 name="uniq_donation_per_request_per_donor",
             )
         ]
+        indexes = [
+            models.Index(fields=["donor_user", "status"]),
+        ]
 
     def mark_verified(self, verifier_user, verified_org=None):
         """
@@ -293,23 +302,8 @@ class BloodDonation(models.Model):
                 )
             except Exception:
                 pass
-            
-            try:
-                from django.apps import apps
-
-                Profile = apps.get_model("accounts", "UserProfile")
-                field_names = {f.name for f in Profile._meta.get_fields()}
-
-                if "last_verified_donation_at" in field_names and "next_eligible_at" in field_names:
-                    elig_days = 90  # keep consistent with blood/eligibility.py ELIGIBILITY_DAYS
-                    next_dt = (self.donated_at + timedelta(days=elig_days)) if self.donated_at else None
-
-                    Profile.objects.filter(user_id=self.donor_user_id).update(
-                        last_verified_donation_at=self.donated_at,
-                        next_eligible_at=next_dt,
-                    )
-            except Exception:
-                pass
+            # profile eligibility cache (last_verified_donation_at / next_eligible_at)
+            # is refreshed by the post_save receiver in blood/signals.py
 
         if not self.request_id:
             return
@@ -1,8 +1,9 @@
-from django.db.models.signals import pre_save, post_delete
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 
 from core.utils.file_cleanup import cleanup_replaced_file, cleanup_file_on_delete
-from .models import PublicBloodRequest, DonationMedicalReport
+from .eligibility import refresh_eligibility_cache
+from .models import BloodDonation, PublicBloodRequest, DonationMedicalReport
 
 
 @receiver(pre_save, sender=PublicBloodRequest)
@@ -22,4 +23,14 @@ def donation_report_cleanup_on_change(sender, instance, **kwargs):
 
 @receiver(post_delete, sender=DonationMedicalReport)
 def donation_report_cleanup_on_delete(sender, instance, **kwargs):
-    cleanup_file_on_delete(instance, "file")
\ No newline at end of file
+    cleanup_file_on_delete(instance, "file")
+
+
+# --- Donor eligibility cache on UserProfile ---
+# any save/delete can change the donor's latest VERIFIED donation
+# (verify, admin status edit, reject, date fix), so recompute it from the table
+@receiver(post_save, sender=BloodDonation)
+@receiver(post_delete, sender=BloodDonation)
+def donation_refresh_donor_eligibility(sender, instance, **kwargs):
+    if instance.donor_user_id:
+        refresh_eligibility_cache(instance.donor_user_id)
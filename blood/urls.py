@@ -14,7 +14,7 @@ urlpatterns = [
     path('donor/history/', views.donor_history_view, name='donor_history'),
     path('donation/<int:donation_id>/report/upload/', views.donation_report_upload_view, name='donation_report_upload'),
     path('report/<int:report_id>/download/', views.donation_report_download_view, name='donation_report_download'),
-    path("donation/<int:donation_id>/verify/", views.verify_donation_view, name="org_verify_donation"),
+    path("donation/<int:donation_id>/verify/", views.verify_donation_view, name="blood_verify_donation"),
     
     # donor verify request and manage
     path("request/new/", views.recipient_request_view, name="recipient_request"),
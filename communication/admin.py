@@ -10,12 +10,14 @@ class NotificationAdmin(admin.ModelAdmin):
     list_filter = ("category", "level", "created_at", "read_at")
     search_fields = ("user__username", "user__email", "title", "body", "url")
     readonly_fields = ("created_at",)
+    autocomplete_fields = ("user",)
 
 @admin.register(NotificationPreference)
 class NotificationPreferenceAdmin(admin.ModelAdmin):
     list_display = ("user", "email_enabled", "email_emergency_only", "updated_at")
     search_fields = ("user__username", "user__email")
     readonly_fields = ("updated_at",)
+    autocomplete_fields = ("user",)
 
 @admin.register(QueuedEmail)
 class QueuedEmailAdmin(admin.ModelAdmin):
@@ -23,6 +25,7 @@ class QueuedEmailAdmin(admin.ModelAdmin):
     list_filter = ("status", "created_at", "sent_at")
     search_fields = ("to_email", "subject", "body")
     readonly_fields = ("created_at", "sent_at")
+    autocomplete_fields = ("user",)
 
 class ChatMessageInline(admin.TabularInline):
     model = ChatMessage
@@ -40,6 +43,7 @@ class ChatThreadAdmin(admin.ModelAdmin):
         "request__patient_name", "request__hospital_name", "request__location_city"
     )
     readonly_fields = ("created_at", "updated_at")
+    autocomplete_fields = ("request", "requester", "donor")
     inlines = [ChatMessageInline]
 
 @admin.register(ChatMessage)
@@ -47,4 +51,5 @@ class ChatMessageAdmin(admin.ModelAdmin):
     list_display = ("id", "thread", "sender", "created_at")
     list_filter = ("created_at",)
     search_fields = ("sender__username", "body")
-    readonly_fields = ("created_at",)
\ No newline at end of file
+    readonly_fields = ("created_at",)
+    autocomplete_fields = ("thread", "sender")
\ No newline at end of file
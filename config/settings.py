@@ -127,6 +127,7 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
     {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
+    {"NAME": "accounts.validators.NotCurrentPasswordValidator"},
 ]
 
 # Internationalization
@@ -210,6 +211,24 @@ else:
         }
     }
 
+# Cache (cache_page / low-level cache). Redis when enabled, else per-process memory
+USE_REDIS_CACHE = os.environ.get("USE_REDIS_CACHE", "0") == "1"
+
+if USE_REDIS_CACHE and REDIS_URL.startswith(("redis://", "rediss://", "unix://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "s4l",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # Guest emergency anti-spam limits
 S4L_GUEST_EMERGENCY_MIN_INTERVAL_SECONDS = 600
 S4L_GUEST_EMERGENCY_MAX_PER_HOUR_IP = 5
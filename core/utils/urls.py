@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from django.urls import reverse
+from django.utils.functional import lazy
+
+
+@lru_cache(maxsize=512)
+def cached_reverse(viewname: str) -> str:
+    """
+    reverse() for argument-free route names, resolved once per process.
+    The URLConf is fixed after startup, so the result never changes.
+    Routes with args/kwargs (pk, tokens) should keep using reverse().
+    """
+    return reverse(viewname)
+
+
+# drop-in for reverse_lazy() in class attributes / as_view() kwargs
+cached_reverse_lazy = lazy(cached_reverse, str)
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 19:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crowdfunding', '0006_alter_campaign_status_alter_campaignauditlog_action'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(fields=['donor_user', 'status'], name='crowdfundin_donor_u_3e647d_idx'),
+        ),
+    ]
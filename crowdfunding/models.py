@@ -210,6 +210,7 @@ class Donation(models.Model):
         indexes = [
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["gateway", "status"]),
+            models.Index(fields=["donor_user", "status"]),
         ]
 
     def donor_display(self):
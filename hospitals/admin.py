@@ -31,8 +31,14 @@ class OrganizationAdmin(admin.ModelAdmin):
             self.message_user(request, f"Email failed to {to_email}: {e}", level=messages.WARNING)
 
     def _activate_memberships(self, org):
-        # activate members when org is approved
-        for m in org.memberships.select_related("user").all():
+        # activate members when org is approved. organization_id is read when the related
+        # manager attaches `org` to each row, and user.save() runs the profile_image cleanup
+        # pre_save handler: load both columns up front (no deferred fetch per member)
+        members = org.memberships.select_related("user").only(
+            "id", "organization", "is_active", "role",
+            "user__id", "user__is_hospital_admin", "user__profile_image",
+        )
+        for m in members:
             if not m.is_active:
                 m.is_active = True
                 m.save(update_fields=["is_active"])
@@ -41,7 +47,7 @@ class OrganizationAdmin(admin.ModelAdmin):
                 m.user.save(update_fields=["is_hospital_admin"])
 
     def _deactivate_memberships(self, org):
-        for m in org.memberships.all():
+        for m in org.memberships.only("id", "organization", "is_active"):
             if m.is_active:
                 m.is_active = False
                 m.save(update_fields=["is_active"])
@@ -153,6 +159,7 @@ class OrganizationMembershipAdmin(admin.ModelAdmin):
     list_display = ("organization", "user", "role", "is_active", "added_at")
     list_filter = ("role", "is_active")
     search_fields = ("organization__name", "user__username", "user__email")
+    autocomplete_fields = ("organization", "user", "added_by")
 
 
 
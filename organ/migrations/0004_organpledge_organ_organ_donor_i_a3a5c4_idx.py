@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-16 19:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hospitals', '0005_bloodcampaign_actual_donors_count_and_more'),
+        ('organ', '0003_organpledge_slug_organrequest_slug'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organpledge',
+            index=models.Index(fields=['donor', 'status'], name='organ_organ_donor_i_a3a5c4_idx'),
+        ),
+    ]
@@ -98,6 +98,7 @@ class OrganPledge(models.Model):
         indexes = [
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["pledge_type", "status"]),
+            models.Index(fields=["donor", "status"]),
         ]
 
     def __str__(self):